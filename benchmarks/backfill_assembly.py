@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+
+"""
+benchmark of the cpu time spent assembling backfill rows into a data frame
+    -> statsapi is not called: each game's features are synthetic
+    -> 'legacy' is the old one-row frame + .at assignments + pd.concat per game
+    -> 'records' is a dictionary per game assembled into a frame once
+
+usage: python3 benchmarks/backfill_assembly.py [num_games ...]
+"""
+
+from typing import Dict, List
+import pandas as pd  # type: ignore
+import random
+import time
+import sys
+import os
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, parent_dir)
+
+from data import COLUMNS, LeagueStats  # noqa: E402
+
+STRING_COLS = ["date", "home-team", "away-team"]
+
+
+def synthetic_rows(num_games: int) -> List[Dict]:
+    """function to make rows shaped like make_game_row's output"""
+    rng = random.Random(0)
+    rows = []
+    for i in range(num_games):
+        row: Dict = {col: rng.random() for col in COLUMNS}
+        row["game-id"] = 700000 + i
+        row["date"] = "2023-05-01"
+        row["home-team"], row["away-team"] = "New York Mets", "Atlanta Braves"
+        row["did-home-win"] = bool(i % 2)
+        rows.append(row)
+    return rows
+
+
+def legacy(mlb: LeagueStats, rows: List[Dict]) -> pd.DataFrame:
+    """assembly used by get_data before rows were built as records"""
+    data = mlb.declareDf()
+    for row in rows:
+        game_df = mlb.declareDf()
+        game_df["did-home-win"] = game_df["did-home-win"].astype(bool)
+        game_df[STRING_COLS] = game_df[STRING_COLS].astype(str)
+        for col in COLUMNS:
+            game_df.at[0, col] = row[col]
+        data = pd.concat([data, game_df], ignore_index=True)
+    return data
+
+
+def records(mlb: LeagueStats, rows: List[Dict]) -> pd.DataFrame:
+    """assembly used by get_data now"""
+    return mlb.rows_to_df([dict(row) for row in rows])
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1000, 2000]
+    mlb = LeagueStats()
+    print(f"{'games':>8} {'legacy (s)':>12} {'records (s)':>12} {'per 1000 legacy':>16}"
+          f" {'per 1000 records':>17}")
+    for num_games in sizes:
+        rows = synthetic_rows(num_games)
+        times = []
+        for assemble in (legacy, records):
+            start = time.process_time()
+            df = assemble(mlb, rows)
+            times.append(time.process_time() - start)
+            assert len(df) == num_games
+        per_1000 = [t * 1000 / num_games for t in times]
+        print(
+            f"{num_games:>8} {times[0]:>12.3f} {times[1]:>12.3f}"
+            f" {per_1000[0]:>16.3f} {per_1000[1]:>17.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+
+"""
+benchmark of the time it takes to import each entry point in a fresh interpreter
+    -> nothing is called: only the import (what every run of the script pays first)
+    -> each module is imported REPEATS times and the fastest time is kept
+    -> the heaviest imports (cumulative, from python -X importtime) are listed
+
+usage: python3 benchmarks/import_time.py [module ...]
+"""
+
+from typing import List, Tuple
+import subprocess
+import time
+import sys
+import os
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# entry points (and the modules they start with)
+MODULES = ["server.tweet", "server.publisher", "ledger", "data_retriever", "predict", "main"]
+
+# seconds an entry point may take to import
+IMPORT_BUDGET = 0.5
+REPEATS = 3
+TOP_N = 5
+
+
+def import_time(module: str) -> float:
+    """function to get the fastest wall time of importing a module in a new process"""
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", f"import {module}"],
+            cwd=parent_dir,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def direct_imports(module: str) -> List[Tuple[str, float]]:
+    """function to get the modules imported by the top level of an import"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=parent_dir,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # only imports made directly by the module (one level of indentation)
+        if name.startswith("   ") and not name.startswith("    "):
+            try:
+                imports.append((name.strip(), int(cumulative) / 1e6))
+            except ValueError:
+                continue
+    return imports
+
+
+def heaviest_imports(module: str) -> List[Tuple[str, float]]:
+    """function to get the imports of a module that took the longest"""
+    # leave out what the interpreter imports at start-up (e.g. site packages)
+    start_up = set(name for name, _ in direct_imports("os"))
+    imports = [item for item in direct_imports(module) if item[0] not in start_up]
+    return sorted(imports, key=lambda item: -item[1])[:TOP_N]
+
+
+if __name__ == "__main__":
+    modules = sys.argv[1:] or MODULES
+    baseline = import_time("os")
+    print(f"interpreter start-up: {baseline:.3f}s (included below)\n")
+    over_budget = []
+    for module in modules:
+        seconds = import_time(module)
+        status = "ok" if seconds <= IMPORT_BUDGET else "OVER BUDGET"
+        print(f"{module:<20} {seconds:.3f}s  [{status}]")
+        for name, cumulative in heaviest_imports(module):
+            print(f"    {name:<24} {cumulative:.3f}s")
+        if seconds > IMPORT_BUDGET:
+            over_budget.append(module)
+    print(f"\nbudget: {IMPORT_BUDGET:.1f}s per entry point")
+    sys.exit(1 if over_budget else 0)
@@ -0,0 +1,70 @@
+#!/usr/bin/python3
+
+"""
+benchmark of the time spent scoring perturbed samples of a day's slate
+    -> statsapi is not called: a synthetic model and features are used
+    -> 'loop' is the old np.random.normal + predict call per simulation per game
+    -> 'tensor' is every simulation of every game scored in one predict call
+
+usage: python3 benchmarks/perturbation_ensemble.py [num_games] [num_simulations ...]
+"""
+
+import lightgbm as lgb  # type: ignore
+import numpy as np  # type: ignore
+import time
+import sys
+import os
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, parent_dir)
+
+from data import LeagueStats, order2  # noqa: E402
+from registry import ModelBundle  # noqa: E402
+
+
+def synthetic_bundle() -> ModelBundle:
+    """function to train a small booster on random features shaped like order2"""
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(2000, len(order2)))
+    y = (x[:, 0] + rng.normal(size=2000) > 0).astype(int)
+    params = {"objective": "binary", "num_leaves": 31, "verbose": -1}
+    booster = lgb.train(params, lgb.Dataset(x, y), num_boost_round=100)
+    return ModelBundle("synthetic", "order2", order2, booster, None)
+
+
+def loop(
+    mlb: LeagueStats, bundle: ModelBundle, x_pred: np.ndarray, num_simulations: int
+) -> None:
+    """scoring used by predict_game before the ensemble was vectorized"""
+    for row in x_pred:
+        row = row[np.newaxis]
+        for _ in range(num_simulations):
+            perturbation = np.random.normal(loc=0, scale=0.001, size=row.shape)
+            float(bundle.booster.predict(row + perturbation)[0])
+
+
+def tensor(
+    mlb: LeagueStats, bundle: ModelBundle, x_pred: np.ndarray, num_simulations: int
+) -> None:
+    """scoring used by predict_game(s) now"""
+    mlb.simulate_predictions(bundle, x_pred, num_simulations, 0.001)
+
+
+def main():
+    num_games = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    sims = [int(arg) for arg in sys.argv[2:]] or [10, 1000]
+    mlb = LeagueStats()
+    bundle = synthetic_bundle()
+    x_pred = np.random.default_rng(1).normal(size=(num_games, len(order2)))
+    print(f"{'games':>6} {'simulations':>12} {'loop (s)':>10} {'tensor (s)':>11}")
+    for num_simulations in sims:
+        times = []
+        for score in (loop, tensor):
+            start = time.perf_counter()
+            score(mlb, bundle, x_pred, num_simulations)
+            times.append(time.perf_counter() - start)
+        print(f"{num_games:>6} {num_simulations:>12} {times[0]:>10.3f} {times[1]:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
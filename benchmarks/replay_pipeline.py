@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+
+"""
+benchmark of the prediction pipeline against a recorded slate (no network in replay)
+    -> 'record' runs the pipeline against statsapi and the-odds-api and saves every
+       response to a fixture directory
+    -> 'replay' runs the same pipeline from the fixture, with the clock set to the
+       time it was recorded, and times each stage
+    -> stages: make_game_df, get_data, generate_daily_predictions, create_tweets
+    -> the ledger, outbox and odds store are temporary so nothing real is touched
+    -> a stage that fails is left out of the total and the run exits with status 1
+
+usage: python3 benchmarks/replay_pipeline.py record <fixture> [MM/DD/YYYY]
+       python3 benchmarks/replay_pipeline.py replay <fixture> [--profile]
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+from datetime import datetime
+import contextlib
+import tempfile
+import cProfile
+import pstats
+import time
+import sys
+import os
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, parent_dir)
+
+from replay import FIXTURES_DIR, RECORD, REPLAY, FixtureMissing, ReplayTransport  # noqa: E402
+from server.odds_store import odds_store  # noqa: E402
+from server.outbox import outbox  # noqa: E402
+from ledger import ledger  # noqa: E402
+import server.tweet_generator  # noqa: E402
+import server.get_odds  # noqa: E402
+import predict  # noqa: E402
+
+PROFILE_LINES = 15
+
+
+def frozen_datetime(when: datetime) -> type:
+    """function to make a datetime class whose now() is always the given time"""
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            if tz is None:
+                return cls.fromtimestamp(when.timestamp())
+            return cls.fromtimestamp(when.timestamp(), tz)
+
+    return FrozenDatetime
+
+
+@contextlib.contextmanager
+def sandbox(now: datetime):
+    """context manager with temporary stores and the clock of the pipeline set to now"""
+    modules = [predict, server.get_odds, server.tweet_generator]
+    paths = (ledger.db_path, outbox.db_path, odds_store.db_path)
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger.db_path = os.path.join(tmp, "predictions.db")
+        outbox.db_path = os.path.join(tmp, "outbox.db")
+        odds_store.db_path = os.path.join(tmp, "odds.db")
+        for module in modules:
+            module.datetime = frozen_datetime(now)
+        try:
+            yield
+        finally:
+            for module in modules:
+                module.datetime = datetime
+            ledger.db_path, outbox.db_path, odds_store.db_path = paths
+
+
+def stages(day: str) -> Dict[str, Callable]:
+    """function to get each stage of the pipeline for the given day"""
+    state: Dict = {}
+
+    def first_game_df():
+        games = predict.mlb.get_schedule(day)
+        return predict.mlb.make_game_df(games[0]["game_id"]) if games else None
+
+    def daily_predictions():
+        state["tweet_lines"] = predict.generate_daily_predictions(
+            date=predict.datetime.now()
+        )
+        return state["tweet_lines"]
+
+    return {
+        "make_game_df": first_game_df,
+        "get_data": lambda: predict.mlb.get_data(day, day, save_to_file=False),
+        "generate_daily_predictions": daily_predictions,
+        "create_tweets": lambda: (
+            predict.create_tweets(state["tweet_lines"]) if state.get("tweet_lines") else []
+        ),
+    }
+
+
+def run(day: str, profile: bool) -> Tuple[List[float], List[str]]:
+    """
+    function to run (and time) every stage of the pipeline
+        -> a stage that fails isn't timed (its time would be of a partial run)
+
+    Returns:
+        times: time of each stage that succeeded
+        failed: names of the stages that failed
+    """
+    times: List[float] = []
+    failed: List[str] = []
+    for name, stage in stages(day).items():
+        profiler = cProfile.Profile() if profile else None
+        start = time.perf_counter()
+        if profiler:
+            profiler.enable()
+        try:
+            stage()
+        except FixtureMissing as e:
+            failed.append(name)
+            print(f"{name} failed: {e} (record the fixture again)")
+            continue
+        except Exception as e:
+            failed.append(name)
+            print(f"{name} failed: {e}")
+            continue
+        finally:
+            if profiler:
+                profiler.disable()
+        times.append(time.perf_counter() - start)
+        print(f"{name:<28} {times[-1]:.3f}s")
+        if profiler:
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(PROFILE_LINES)
+    return times, failed
+
+
+def main(mode: str, fixture: str, day: Optional[str], profile: bool) -> None:
+    fixture_dir = fixture if os.path.isabs(fixture) else os.path.join(FIXTURES_DIR, fixture)
+    transport = ReplayTransport(fixture_dir, mode)
+    if mode == REPLAY and transport.recorded_at is None:
+        print(f"No fixture recorded in {fixture_dir}")
+        sys.exit(1)
+    now = transport.recorded_at if mode == REPLAY else datetime.now()
+    day = day or transport.manifest.get("day") or now.strftime("%m/%d/%Y")
+    with transport.installed(), sandbox(now):
+        transport.manifest["day"] = day
+        print(f"{mode} of {day} ({fixture_dir})\n")
+        times, failed = run(day, profile)
+    print(f"\ntotal                        {sum(times):.3f}s")
+    if failed:
+        print(f"failed stages (not in the total): {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] not in (RECORD, REPLAY):
+        print(__doc__)
+        sys.exit(1)
+    args = [arg for arg in sys.argv[3:] if arg != "--profile"]
+    main(sys.argv[1], sys.argv[2], args[0] if args else None, "--profile" in sys.argv)
@@ -0,0 +1,273 @@
+from typing import Any, Callable, Dict, Optional, Set
+from datetime import datetime, date
+import statsapi  # type: ignore
+import contextlib
+import threading
+import hashlib
+import pickle
+import time
+import json
+import os
+
+cwd = os.path.dirname(os.path.abspath(__file__))
+
+# ttl (seconds) given to responses that can still change
+MUTABLE_TTL = 900  # 0.25 hour
+DAILY_TTL = 86400  # 24 hours
+# ttl given to responses that will never change (e.g. box score of a Final game)
+IMMUTABLE = None
+
+# limits on requests made to statsapi.mlb.com
+MAX_CONCURRENT_REQUESTS = 8
+REQUESTS_PER_SECOND = 10.0
+
+# marks a response that isn't cached (None is a valid statsapi response)
+MISS = object()
+
+# game statuses after which a game's schedule entry and box score no longer change
+# (not "Postponed": a postponed game is rescheduled and its record changes)
+TERMINAL_STATUSES = {"Final", "Game Over", "Completed Early", "Cancelled"}
+
+
+class RateLimiter:
+    """
+    limits the requests made to a single host
+        -> at most max_concurrent requests are in flight at once
+        -> at most per_second requests are started each second
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+        per_second: float = REQUESTS_PER_SECOND,
+    ):
+        self.semaphore = threading.BoundedSemaphore(max_concurrent)
+        self.interval = 1.0 / per_second
+        self.lock = threading.Lock()
+        self.next_start = 0.0
+
+    @contextlib.contextmanager
+    def slot(self):
+        """context manager to hold while making a single request"""
+        with self.semaphore:
+            with self.lock:
+                now = time.monotonic()
+                wait = self.next_start - now
+                self.next_start = max(now, self.next_start) + self.interval
+            if wait > 0:
+                time.sleep(wait)
+            yield
+
+
+class StatsApiCache:
+    """
+    on-disk cache that sits in front of every statsapi call made while building data
+        -> responses are pickled to <cache_dir>/<endpoint>/<key>.pkl
+        -> key is a hash of the endpoint's parameters
+        -> each endpoint decides how long its responses stay valid
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, enabled: bool = True):
+        self.cache_dir = cache_dir or os.path.join(cwd, "data/cache")
+        self.enabled = enabled
+        # ids of games known to be over (box scores for these never change)
+        self.final_ids: Set[int] = set()
+        # every statsapi call goes to the same host so they share one limiter
+        self.limiter = RateLimiter()
+        # one lock per cached file so concurrent misses only make one request
+        self.key_locks: Dict[str, threading.Lock] = {}
+        self.key_locks_lock = threading.Lock()
+
+    def _path(self, endpoint: str, params: Dict) -> str:
+        """
+        method to get the file path that a response is stored at
+
+        Args:
+            endpoint: name of the statsapi function
+            params: parameters the function is called with
+
+        Returns:
+            path: file path of the cached response
+        """
+        raw = json.dumps(params, sort_keys=True, default=str)
+        key = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, endpoint, f"{key}.pkl")
+
+    def _read(self, path: str) -> Any:
+        """
+        method to read a cached response from disk if it exists and hasn't expired
+
+        Args:
+            path: file path of the cached response
+
+        Returns:
+            response: cached response or MISS if missing/expired
+        """
+        try:
+            with open(path, "rb") as f:
+                expires, response = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return MISS
+        if expires is not None and expires < time.time():
+            return MISS
+        return response
+
+    def _write(self, path: str, response: Any, ttl: Optional[int]) -> None:
+        """
+        method to write a response to disk
+            -> written to a temporary file first so readers never see partial files
+
+        Args:
+            path: file path of the cached response
+            response: statsapi response to store
+            ttl: seconds the response stays valid (None for never expires)
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        expires = None if ttl is None else time.time() + ttl
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((expires, response), f)
+        os.replace(tmp_path, path)
+
+    def _call(
+        self,
+        endpoint: str,
+        func: Callable,
+        ttl_policy: Callable[[Dict, Any], Optional[int]],
+        **params,
+    ) -> Any:
+        """
+        method to return a cached response or make the call and cache its response
+
+        Args:
+            endpoint: name of the statsapi function
+            func: statsapi function to call on a cache miss
+            ttl_policy: function of (params, response) returning the response's ttl
+            params: keyword parameters for func
+
+        Returns:
+            response: response of func(**params)
+        """
+        if not self.enabled:
+            with self.limiter.slot():
+                return func(**params)
+        path = self._path(endpoint, params)
+        response = self._read(path)
+        if response is not MISS:
+            return response
+        with self.key_locks_lock:
+            key_lock = self.key_locks.setdefault(path, threading.Lock())
+        with key_lock:
+            # another thread may have fetched it while we waited
+            response = self._read(path)
+            if response is MISS:
+                with self.limiter.slot():
+                    response = func(**params)
+                self._write(path, response, ttl_policy(params, response))
+        return response
+
+    def _schedule_ttl(self, params: Dict, games: Any) -> Optional[int]:
+        """schedules are immutable once every game in them is over"""
+        if games and all(game.get("status") in TERMINAL_STATUSES for game in games):
+            return IMMUTABLE
+        return MUTABLE_TTL
+
+    def _boxscore_ttl(self, params: Dict, box: Any) -> Optional[int]:
+        """box scores are immutable once the game is known to be over"""
+        if int(params["gamePk"]) in self.final_ids:
+            return IMMUTABLE
+        return MUTABLE_TTL
+
+    def _standings_ttl(self, params: Dict, standings: Any) -> Optional[int]:
+        """standings as of a past date never change"""
+        request_date = params.get("date")
+        if request_date:
+            as_of = datetime.strptime(request_date, "%m/%d/%Y").date()
+            if as_of < date.today():
+                return IMMUTABLE
+        return MUTABLE_TTL
+
+    def _season_ttl(self, params: Dict, response: Any) -> Optional[int]:
+        """season scoped data from a past season never changes"""
+        season = params.get("season")
+        if season and int(season) < date.today().year:
+            return IMMUTABLE
+        return DAILY_TTL
+
+    def schedule(self, **params) -> Any:
+        games = self._call("schedule", statsapi.schedule, self._schedule_ttl, **params)
+        for game in games:
+            if game.get("status") in TERMINAL_STATUSES:
+                self.final_ids.add(int(game["game_id"]))
+        return games
+
+    def boxscore_data(self, gamePk: Any) -> Any:
+        return self._call(
+            "boxscore_data", statsapi.boxscore_data, self._boxscore_ttl, gamePk=gamePk
+        )
+
+    def standings_data(self, leagueId: str = "103,104", **params) -> Any:
+        return self._call(
+            "standings_data",
+            statsapi.standings_data,
+            self._standings_ttl,
+            leagueId=leagueId,
+            **params,
+        )
+
+    def player_stat_data(self, personId: Any, **params) -> Any:
+        return self._call(
+            "player_stat_data",
+            statsapi.player_stat_data,
+            lambda params, response: DAILY_TTL,
+            personId=personId,
+            **params,
+        )
+
+    def team_leader_data(self, teamId: Any, leaderCategories: str, **params) -> Any:
+        return self._call(
+            "team_leader_data",
+            statsapi.team_leader_data,
+            self._season_ttl,
+            teamId=teamId,
+            leaderCategories=leaderCategories,
+            **params,
+        )
+
+    def lookup_player(self, lookup_value: str, **params) -> Any:
+        return self._call(
+            "lookup_player",
+            statsapi.lookup_player,
+            self._season_ttl,
+            lookup_value=lookup_value,
+            **params,
+        )
+
+    def get(self, endpoint: str, params: Dict, ttl: Optional[int] = MUTABLE_TTL) -> Any:
+        # responses are stored under data/cache/get/<endpoint>/
+        return self._call(
+            f"get/{endpoint}",
+            lambda params: statsapi.get(endpoint, params),
+            lambda params, response: ttl,
+            params=params,
+        )
+
+    def last_game(self, teamId: Any) -> Any:
+        return self._call(
+            "last_game",
+            statsapi.last_game,
+            lambda params, response: MUTABLE_TTL,
+            teamId=teamId,
+        )
+
+    def next_game(self, teamId: Any) -> Any:
+        return self._call(
+            "next_game",
+            statsapi.next_game,
+            lambda params, response: MUTABLE_TTL,
+            teamId=teamId,
+        )
+
+
+# shared cache used by data.py
+api = StatsApiCache()
@@ -1,37 +1,33 @@
-from typing import List, Tuple, Optional, Union, Dict
+from typing import TYPE_CHECKING, List, Tuple, Optional, Union, Dict
 from datetime import datetime, timedelta, date
+from concurrent.futures import ThreadPoolExecutor
 from urllib.error import HTTPError
 from dotenv import load_dotenv  # type: ignore
-import lightgbm as lgb  # type: ignore
-import pandas as pd  # type: ignore
+from store import save_games
+from team_index import GAME_TYPES, team_index
+from standings import standings
+from pitchers import pitchers
+from leaders import team_leaders
+from registry import registry, ModelBundle
+from cache import api, MAX_CONCURRENT_REQUESTS
+from teams import teams
 import numpy as np  # type: ignore
-import statsapi  # type: ignore
-import contextlib
-import subprocess
-import pickle
 import time
-import json
 import os
-import io
-
-IDS = [
-    "id_to_team",
-    "team_to_id",
-    "team_to_abbreviation",
-    "league_dict",
-    "division_teams",
-    "division_to_id",
-    "id_to_division",
-]
 
-# to satisfy type checker...
-id_to_team: Dict[str, str] = {}
-team_to_id: Dict[str, str] = {}
-team_to_abbreviation: Dict[str, str] = {}
-league_dict: Dict[str, int] = {}
-division_teams: Dict[str, List[str]] = {}
-division_to_id: Dict[str, int] = {}
-id_to_division: Dict[int, str] = {}
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore
+
+# days averaged by the last10 features: the 11 days ending the day before a game
+# (kept at 11 to match the days used by the training data)
+LAST10_WINDOW_DAYS = 11
+
+# number of games between progress updates while building data
+PROGRESS_INTERVAL = 25
+
+# perturbed samples scored per game and the quantiles reported of their predictions
+NUM_SIMULATIONS = 1000
+QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
 
 cwd = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -130,28 +126,114 @@ order2 = [
     "away-starter-career-era",
 ]
 
+# feature orders by the name used in .env (FEATURE_ORDER)
+ORDERS = {"order1": order1, "order2": order2}
 
-class LeagueStats:
-    def __init__(self):
-        self.retrieve_ids(IDS)
+# columns of a game's data (standard data frame format)
+COLUMNS = [
+    "game-id",
+    "date",
+    "home-team",
+    "away-team",
+    "did-home-win",
+    "home-win-percentage",
+    "away-win-percentage",
+    "home-last10-avg-runs",
+    "home-last10-avg-runs-allowed",
+    "away-last10-avg-runs",
+    "away-last10-avg-runs-allowed",
+    "home-last10-avg-hits",
+    "home-last10-avg-hits-allowed",
+    "away-last10-avg-hits",
+    "away-last10-avg-hits-allowed",
+    "home-last10-avg-ops",
+    "away-last10-avg-ops",
+    "home-last10-avg-strikeouts",
+    "away-last10-avg-strikeouts",
+    "home-last10-avg-obp",
+    "away-last10-avg-obp",
+    "home-last10-avg-avg",
+    "away-last10-avg-avg",
+    "home-last10-avg-rbi",
+    "away-last10-avg-rbi",
+    "home-starter-career-era",
+    "away-starter-career-era",
+    "home-starter-season-era",
+    "away-starter-season-era",
+    "home-starter-season-avg",
+    "away-starter-season-avg",
+    "home-starter-season-runs-per9",
+    "away-starter-season-runs-per9",
+    "home-starter-season-win-percentage",
+    "away-starter-season-win-percentage",
+    "home-starter-season-whip",
+    "away-starter-season-whip",
+    "home-starter-season-strike-percentage",
+    "away-starter-season-strike-percentage",
+    "home-top5-hr-avg",
+    "away-top5-hr-avg",
+    "home-top5-rbi-avg",
+    "away-top5-rbi-avg",
+    "home-top5-batting-avg",
+    "away-top5-batting-avg",
+    "home-top5-stolenBases-avg",
+    "away-top5-stolenBases-avg",
+    "home-top5-totalBases-avg",
+    "away-top5-totalBases-avg",
+]
 
-    def retrieve_ids(self, variables: List[str]) -> None:
+
+class GameContext:
+    """
+    a single game's schedule entry along with the details feature builders need
+        -> built once per game so each builder doesn't re-request the schedule
+    """
+
+    def __init__(self, game: Dict):
+        self.game = game
+        self.id = game["game_id"]
+        self.date = datetime.strptime(game["game_date"], "%Y-%m-%d")
+        self.season = game["game_date"][0:4]
+        self.home_id, self.away_id = game["home_id"], game["away_id"]
+        self.home_name, self.away_name = game["home_name"], game["away_name"]
+        self.home_probable, self.away_probable = (
+            game.get("home_probable_pitcher"),
+            game.get("away_probable_pitcher"),
+        )
+
+    def __repr__(self):
+        return f"{self.game.get('summary')}"
+
+    def info(self) -> Dict:
         """
-        method to retrieve ids and translation data from the ids.json file
-            -> generates that file if needed
+        method to get the game details saved alongside a prediction
 
+        Returns:
+            game_info: python dictionary with info about the game
+        """
+        game_info = {}
+        game_info["datetime"] = self.game.get("game_datetime")
+        game_info["date"] = self.game.get("game_date")
+        game_info["away"] = self.away_name
+        game_info["home"] = self.home_name
+        game_info["home_probable"] = self.home_probable
+        game_info["away_probable"] = self.away_probable
+        game_info["venue"] = self.game.get("venue_name")
+        game_info["national_broadcasts"] = self.game.get("national_broadcasts")
+        game_info["series_status"] = self.game.get("series_status")
+        game_info["summary"] = self.game.get("summary")
+        game_info["game_id"] = self.id
+        return game_info
+
+
+class LeagueStats:
+    def __init__(self, as_of_stats: bool = False):
+        """
         Args:
-            variables: List of strings of identifiers to retrieve
-        """
-        ids_filepath = os.path.join(cwd, "data/ids.json")
-        script_path = os.path.join(cwd, "data/generate_ids.py")
-        if not os.path.isfile(ids_filepath):
-            subprocess.run(["python3", script_path])
-        with open(ids_filepath, "r") as f:
-            data = json.load(f)
-        for key in variables:
-            if key in data:
-                globals()[key] = data[key]
+            as_of_stats: bool indicating if starting pitcher season stats should
+                only include games before each game (instead of the whole season)
+        """
+        self.as_of_stats = as_of_stats
 
     def get_division(self, team: str) -> Optional[Union[Tuple[str, int], None]]:
         """
@@ -163,9 +245,9 @@ class LeagueStats:
         Returns:
             division name (e.g. "NL East"), division API id (e.g 201)
         """
-        for division in division_teams:
-            if team in division_teams[division]:
-                return division, division_to_id[division]
+        for division, division_teams in teams.division_teams.items():
+            if team in division_teams:
+                return division, teams.division_to_id[division]
         return None
 
     def get_division_standings(
@@ -183,7 +265,7 @@ class LeagueStats:
         """
         if not request_date:
             request_date = date.today().strftime("%m/%d/%Y")
-        standings = statsapi.standings_data("103,104", date=request_date).get(
+        standings = api.standings_data("103,104", date=request_date).get(
             division_id
         )
         if standings:
@@ -226,11 +308,11 @@ class LeagueStats:
             gamePk: id of the team's next to-be-played game
             schedule: python dictionary with game details
         """
-        id = team_to_id.get(team)
+        id = teams.id(team)
         if not id:
             return None, None
-        gamePk = statsapi.next_game(id)
-        next = statsapi.schedule(game_id=gamePk)
+        gamePk = api.next_game(id)
+        next = api.schedule(game_id=gamePk)
         return gamePk, next[0]
 
     def get_days_games(self, team: str, date: str) -> Optional[List[Dict]]:
@@ -245,12 +327,24 @@ class LeagueStats:
             gamePks: id of the team's next to-be-played game
             schedule: python dictionary with game details
         """
-        id = team_to_id.get(team)
+        id = teams.id(team)
         if not id:
             return None
-        games = statsapi.schedule(start_date=date, end_date=date, team=id)
+        games = api.schedule(start_date=date, end_date=date, team=id)
         return games
 
+    def get_schedule(self, date: str) -> List[Dict]:
+        """
+        method to get every game on the given day with a single request
+
+        Args:
+            date: date to get games for (MM/DD/YYYY)
+
+        Returns:
+            schedule: list of python dictionaries with game details
+        """
+        return api.schedule(start_date=date, end_date=date)
+
     def get_last_game(
         self, team: str
     ) -> Optional[Union[Tuple[str, Dict], Tuple[None, None]]]:
@@ -264,13 +358,27 @@ class LeagueStats:
             gamePk: id of the team's next to-be-played game
             schedule: python dictionary with game details
         """
-        id = team_to_id.get(team)
+        id = teams.id(team)
         if not id:
             return None, None
-        gamePk = statsapi.last_game(id)
-        next = statsapi.schedule(game_id=gamePk)
+        gamePk = api.last_game(id)
+        next = api.schedule(game_id=gamePk)
         return gamePk, next[0]
 
+    def get_game_context(self, game: Union[str, GameContext]) -> GameContext:
+        """
+        method to build the context of a game (a single schedule request)
+
+        Args:
+            game: game id of the game or an already built GameContext
+
+        Returns:
+            context: GameContext for the game
+        """
+        if isinstance(game, GameContext):
+            return game
+        return GameContext(api.schedule(game_id=game)[0])
+
     def get_player_id(
         self, player_name: str, season: Optional[str] = None
     ) -> Optional[Union[str, None]]:
@@ -284,17 +392,15 @@ class LeagueStats:
         Returns:
             player_id: a player's id for use with the api as a parameter
         """
-        player = statsapi.lookup_player(player_name, season=season)
-        if not player:
-            return None
-        return player[0].get("id")
+        return pitchers.player_id(player_name, season=season)
 
-    def get_starting_pitcher_stats(self, gamePk: str) -> Dict:
+    def get_starting_pitcher_stats(self, game: GameContext) -> Dict:
         """
-        method that will get the required stats about a starting pitcher given a game ID
+        method that will get the required stats about a starting pitcher given a game
+            -> ids and stat lines come from the shared PitcherRepository
 
         Args:
-            gamePk: game id of the game to retrieve data from
+            game: context of the game to retrieve data from
 
         Returns:
             starters_stats: python dictionary with stats from both pitchers for a game
@@ -302,32 +408,20 @@ class LeagueStats:
                    seasons runs/9, season win percentage,
         """
         starters_stats = {}
-        game = statsapi.schedule(game_id=gamePk)[0]
-        home_starter, away_starter = (
-            game["home_probable_pitcher"],
-            game["away_probable_pitcher"],
-        )
-        season = game["game_date"][0:4]
+        home_starter, away_starter = game.home_probable, game.away_probable
+        season = game.season
+        # stats through the day before the game (if as_of_stats) or the whole season
+        as_of = (game.date - timedelta(days=1)).date() if self.as_of_stats else None
         for pitcher in [("home", home_starter), ("away", away_starter)]:
             if not pitcher[1]:
                 continue
             pitcher_id = self.get_player_id(pitcher[1], season=season)
             if not pitcher_id:
                 continue
-            seasons = statsapi.player_stat_data(
-                pitcher_id, group="pitching", type="yearByYear"
-            ).get("stats")
-            season_stats = {}
-            if seasons:
-                for year in seasons:
-                    if year["season"] == season:
-                        season_stats = year["stats"]
-            career_stats = statsapi.player_stat_data(
-                pitcher_id, group="pitching", type="career"
-            )["stats"]
+            season_stats = pitchers.season_stats(pitcher_id, season, as_of=as_of)
+            career_stats = pitchers.career_stats(pitcher_id)
             if not career_stats:
                 continue
-            career_stats = career_stats[0]["stats"]
             starters_stats[f"{pitcher[0]}-starter-career-era"] = career_stats.get("era")
             # if no season stats, use career stats in place
             if season_stats:
@@ -362,120 +456,51 @@ class LeagueStats:
                 starters_stats[f"{pitcher[0]}-starter-season-win-percentage"] = win_pct
         return starters_stats
 
-    def get_last10_stats(self, gamePk: str) -> Dict:
+    def get_last10_stats(
+        self, game: GameContext, window_days: int = LAST10_WINDOW_DAYS
+    ) -> Dict:
         """
         method to get/calculate a team's average stats over the past 10 days
+            -> window sums come from team_index (box scores are loaded once per day)
 
         Args:
-            gamePk: game id of the game to retrieve data from
+            game: context of the game to retrieve data from
+            window_days: number of days before the game to average over
 
         Returns:
             last10_stats: a python dictionary containing a team's 10 day averages
         """
         last10_stats = {}
-        game = statsapi.schedule(game_id=gamePk)[0]
-        home, away = game["home_id"], game["away_id"]
-        date = datetime.strptime(game["game_date"], "%Y-%m-%d")
-        start_date = date - timedelta(days=11)
-        end_date = date - timedelta(days=1)
-        start, end = start_date.strftime("%m/%d/%Y"), end_date.strftime("%m/%d/%Y")
-        for team in [("home", home), ("away", away)]:
-            last10daygames = statsapi.schedule(
-                team=team[1], start_date=start, end_date=end
-            )
-            # to ensure only uses regular season or playoff games
-            last10daygames = [
-                game
-                for game in last10daygames
-                if game.get("game_type") in ["R", "F", "D", "L", "W", "C", "P"]
-            ]
-            game_ids = []
-            for game in last10daygames:
-                game_ids.append(game["game_id"])
-            (
-                runs,
-                runs_allowed,
-                hits,
-                hits_allowed,
-                ops,
-                pitching_strikouts,
-                pitching_obp,
-                avg,
-                rbi,
-            ) = (0, 0, 0, 0, 0.0, 0, 0.0, 0.0, 0)
-            for id in game_ids:
-                box = statsapi.boxscore_data(id)
-                isHome = box["home"]["team"]["id"] == team[1]
-                game_stats = (
-                    box["home"]["teamStats"] if isHome else box["away"]["teamStats"]
-                )
-                runs += game_stats["batting"]["runs"]
-                hits += game_stats["batting"]["hits"]
-                runs_allowed += game_stats["pitching"]["runs"]
-                hits_allowed += game_stats["pitching"]["hits"]
-                ops += float(game_stats["batting"]["ops"])
-                pitching_strikouts += game_stats["pitching"]["strikeOuts"]
-                pitching_obp += float(game_stats["pitching"]["obp"])
-                avg += float(game_stats["batting"]["avg"])
-                rbi += game_stats["batting"]["rbi"]
-            last10_stats[f"{team[0]}-last10-avg-runs"] = (
-                runs / len(game_ids) if game_ids else None
-            )
-            last10_stats[f"{team[0]}-last10-avg-runs-allowed"] = (
-                runs_allowed / len(game_ids) if game_ids else None
-            )
-            last10_stats[f"{team[0]}-last10-avg-hits"] = (
-                hits / len(game_ids) if game_ids else None
-            )
-            last10_stats[f"{team[0]}-last10-avg-hits-allowed"] = (
-                hits_allowed / len(game_ids) if game_ids else None
-            )
-            last10_stats[f"{team[0]}-last10-avg-ops"] = (
-                ops / len(game_ids) if game_ids else None
-            )
-            last10_stats[f"{team[0]}-last10-avg-strikeouts"] = (
-                pitching_strikouts / len(game_ids) if game_ids else None
-            )
-            last10_stats[f"{team[0]}-last10-avg-obp"] = (
-                pitching_obp / len(game_ids) if game_ids else None
-            )
-            last10_stats[f"{team[0]}-last10-avg-avg"] = (
-                avg / len(game_ids) if game_ids else None
-            )
-            last10_stats[f"{team[0]}-last10-avg-rbi"] = (
-                rbi / len(game_ids) if game_ids else None
-            )
+        start_date = (game.date - timedelta(days=window_days)).date()
+        end_date = (game.date - timedelta(days=1)).date()
+        for team in [("home", game.home_id), ("away", game.away_id)]:
+            averages = team_index.window_averages(team[1], start_date, end_date)
+            for stat, average in averages.items():
+                last10_stats[f"{team[0]}-last10-avg-{stat}"] = average
         return last10_stats
 
     def get_win_percentage(
-        self, gamePk: str
+        self, game: GameContext
     ) -> Optional[Union[Tuple[float, float], None]]:
         """
         method that will retrieve and calculate a team's winning percentage
+            -> standings come from the date's snapshot in standings.py
 
         Args:
-            gamePk: game id of the game to retrieve data from
+            game: context of the game to retrieve data from
 
         Returns:
             home_pct: home team's winning percentage
             away_pct: away team's winning percentage
         """
-        game = statsapi.schedule(game_id=gamePk)[0]
-        game_date = game["game_date"]
-        date_obj = datetime.strptime(game_date, "%Y-%m-%d")
-        game_date = datetime.strftime(date_obj, "%m/%d/%Y")
-        home, away = game["home_name"], game["away_name"]
-        home_div, away_div = self.get_division(home), self.get_division(away)
-        if not home_div or not away_div:
-            return None
-        h_div, a_div = home_div[1], away_div[1]
-        home_standings, away_standings = self.get_division_standings(
-            h_div, request_date=game_date
-        ), self.get_division_standings(a_div, request_date=game_date)
+        game_date = game.date.strftime("%m/%d/%Y")
+        # every team's standings on a date come from a single request
+        home_standings = standings.team(game.home_id, game_date)
+        away_standings = standings.team(game.away_id, game_date)
         if not home_standings or not away_standings:
             return None
-        h_wins, h_loses, *_ = self.get_team_standings(home, home_standings)
-        a_wins, a_loses, *_ = self.get_team_standings(away, away_standings)
+        h_wins, h_loses = home_standings["w"], home_standings["l"]
+        a_wins, a_loses = away_standings["w"], away_standings["l"]
         home_pct = (
             round(h_wins / (h_loses + h_wins), 3) if (h_loses + h_wins) > 0 else 0.000
         )
@@ -484,162 +509,204 @@ class LeagueStats:
         )
         return home_pct, away_pct
 
-    def get_team_leaders(self, gamePk: str) -> Dict:
+    def get_team_leaders(self, game: GameContext) -> Dict:
         """
         method that will retrieve team_leaders in specific stats
+            -> read from the shared daily team leaders cache
 
         Args:
-            gamePk: game id of the game to retrieve data from
+            game: context of the game to retrieve data from
 
         Returns:
             leaders: Dictionary of each team's leaders' stats in key areas
         """
         leaders: Dict = {}
-        game = statsapi.schedule(game_id=gamePk)[0]
-        home_id, away_id = game["home_id"], game["away_id"]
-        season = game["game_date"][0:4]
-        for team in [("home", home_id), ("away", away_id)]:
-            # if first game of the season, use last season's data
-            isFirstGame = True if statsapi.last_game(team[1]) is None else False
-            season = (int(season) - 1) if isFirstGame else season
-
-            # average homeruns among top 5 players
-            hr = statsapi.team_leader_data(team[1], "homeRuns", season=season)
-            top5_hr = [int(item[2]) for item in hr[:5]]
-            top5_hr_avg = sum(top5_hr) / len(top5_hr)
-            leaders[f"{team[0]}-top5-hr-avg"] = top5_hr_avg
-
-            # average RBI among top 5 players
-            rbi = statsapi.team_leader_data(team[1], "runsBattedIn", season=season)
-            top5_rbi = [int(item[2]) for item in rbi[:5]]
-            top5_rbi_avg = sum(top5_rbi) / len(top5_rbi)
-            leaders[f"{team[0]}-top5-rbi-avg"] = top5_rbi_avg
-
-            # average batting avg among top 5 players
-            avg = statsapi.team_leader_data(team[1], "battingAverage", season=season)
-            top5_avg = [float(item[2]) for item in avg[:5]]
-            top5_avg_avg = sum(top5_avg) / len(top5_avg)
-            leaders[f"{team[0]}-top5-batting-avg"] = top5_avg_avg
-
-            # average stolen bases among top 5 players
-            sb = statsapi.team_leader_data(team[1], "stolenBases", season=season)
-            top5_sb = [int(item[2]) for item in sb[:5]]
-            top5_sb_avg = sum(top5_sb) / len(top5_sb)
-            leaders[f"{team[0]}-top5-stolenBases-avg"] = top5_sb_avg
-
-            # average total bases among top 5 players
-            bases = statsapi.team_leader_data(team[1], "totalBases", season=season)
-            top5_bases = [int(item[2]) for item in bases[:5]]
-            top5_bases_avg = sum(top5_bases) / len(top5_bases)
-            leaders[f"{team[0]}-top5-totalBases-avg"] = top5_bases_avg
-
+        for team in [("home", game.home_id), ("away", game.away_id)]:
+            averages = team_leaders.top_averages(team[1], game.season)
+            for name, average in averages.items():
+                leaders[f"{team[0]}-top5-{name}-avg"] = average
         return leaders
 
-    def declareDf(self) -> pd.DataFrame:
+    def declareDf(self) -> "pd.DataFrame":
         """
         method to declare data frame standard format and return an instance of it
         """
-        game_df = pd.DataFrame(
-            columns=[
-                "game-id",
-                "date",
-                "home-team",
-                "away-team",
-                "did-home-win",
-                "home-win-percentage",
-                "away-win-percentage",
-                "home-last10-avg-runs",
-                "home-last10-avg-runs-allowed",
-                "away-last10-avg-runs",
-                "away-last10-avg-runs-allowed",
-                "home-last10-avg-hits",
-                "home-last10-avg-hits-allowed",
-                "away-last10-avg-hits",
-                "away-last10-avg-hits-allowed",
-                "home-last10-avg-ops",
-                "away-last10-avg-ops",
-                "home-last10-avg-strikeouts",
-                "away-last10-avg-strikeouts",
-                "home-last10-avg-obp",
-                "away-last10-avg-obp",
-                "home-last10-avg-avg",
-                "away-last10-avg-avg",
-                "home-last10-avg-rbi",
-                "away-last10-avg-rbi",
-                "home-starter-career-era",
-                "away-starter-career-era",
-                "home-starter-season-era",
-                "away-starter-season-era",
-                "home-starter-season-avg",
-                "away-starter-season-avg",
-                "home-starter-season-runs-per9",
-                "away-starter-season-runs-per9",
-                "home-starter-season-win-percentage",
-                "away-starter-season-win-percentage",
-                "home-starter-season-whip",
-                "away-starter-season-whip",
-                "home-starter-season-strike-percentage",
-                "away-starter-season-strike-percentage",
-                "home-top5-hr-avg",
-                "away-top5-hr-avg",
-                "home-top5-rbi-avg",
-                "away-top5-rbi-avg",
-                "home-top5-batting-avg",
-                "away-top5-batting-avg",
-                "home-top5-stolenBases-avg",
-                "away-top5-stolenBases-avg",
-                "home-top5-totalBases-avg",
-                "away-top5-totalBases-avg",
-            ]
-        )
+        # pandas is imported when needed so importing data (e.g. from predict.py)
+        # stays light
+        import pandas as pd  # type: ignore
+
+        game_df = pd.DataFrame(columns=COLUMNS)
         return game_df
 
-    def make_game_df(self, gamePk: str) -> pd.DataFrame:
+    def make_game_row(
+        self,
+        gamePk: Union[str, GameContext],
+        parallel: bool = False,
+        verbose: bool = True,
+    ) -> Dict:
         """
-        method that will construct a data frame for a single game given the game id
+        method that will construct the data points of a single game given the game id
 
         Args:
-            gamePk: unique game ID of the game
+            gamePk: unique game ID of the game (or its GameContext)
+            parallel: bool indicating if the four groups of features (win
+                percentage, last10, starting pitchers, leaders) are built at once
+            verbose: bool indicating if the time taken to build the row is printed
 
         Returns:
-            game_df: data frame with data points about a specific game
+            row: python dictionary with a value (or None) for every column in COLUMNS
         """
         start_time = time.time()
-        game_df = self.declareDf()
-        game_df["did-home-win"] = game_df["did-home-win"].astype(bool)
-        string_cols = ["date", "home-team", "away-team"]
-        game_df[string_cols] = game_df[string_cols].astype(str)
-        game = statsapi.schedule(game_id=gamePk)[0]
-        game_df.at[0, "did-home-win"] = (
+        row: Dict = dict.fromkeys(COLUMNS)
+        context = self.get_game_context(gamePk)
+        game = context.game
+        row["did-home-win"] = (
             True
-            if game.get("winning_team") == game["home_name"]
-            else (False if game.get("winning_team") == game["away_name"] else None)
+            if game.get("winning_team") == context.home_name
+            else (False if game.get("winning_team") == context.away_name else None)
         )
-        game_df.at[0, "date"] = game["game_date"]
-        game_df.at[0, "game-id"] = game["game_id"]
-        game_df.at[0, "home-team"], game_df.at[0, "away-team"] = (
-            game["home_name"],
-            game["away_name"],
-        )
-        ret = self.get_win_percentage(gamePk)
+        row["date"] = game["game_date"]
+        row["game-id"] = context.id
+        row["home-team"], row["away-team"] = context.home_name, context.away_name
+        builders = [
+            self.get_win_percentage,
+            self.get_last10_stats,
+            self.get_starting_pitcher_stats,
+            self.get_team_leaders,
+        ]
+        if parallel:
+            with ThreadPoolExecutor(max_workers=len(builders)) as executor:
+                results = list(executor.map(lambda build: build(context), builders))
+        else:
+            results = [build(context) for build in builders]
+        ret, last10, starters, leaders = results
         if ret:
-            game_df.at[0, "home-win-percentage"] = ret[0]
-            game_df.at[0, "away-win-percentage"] = ret[1]
-        last10 = self.get_last10_stats(gamePk)
-        for col in last10:
-            game_df.at[0, col] = last10[col]
-        pitching_stats = self.get_starting_pitcher_stats(gamePk)
-        for col in pitching_stats:
-            game_df.at[0, col] = pitching_stats[col]
-        leaders = self.get_team_leaders(gamePk)
-        for col in leaders:
-            game_df.at[0, col] = leaders[col]
+            row["home-win-percentage"] = ret[0]
+            row["away-win-percentage"] = ret[1]
+        row.update(last10)
+        row.update(starters)
+        row.update(leaders)
         function_time = time.time() - start_time
-        print(
-            f"Constructed training data from {game['summary']}"
-            f" in {round(function_time,2)} seconds."
-        )
-        return game_df
+        if verbose:
+            print(
+                f"Constructed training data from {game['summary']}"
+                f" in {round(function_time,2)} seconds."
+            )
+        return row
+
+    def rows_to_df(self, rows: List[Dict]) -> "pd.DataFrame":
+        """
+        method to assemble game rows into the standard data frame format at once
+
+        Args:
+            rows: game rows returned by make_game_row
+
+        Returns:
+            data: data frame with one row per game
+        """
+        import pandas as pd  # type: ignore
+
+        return pd.DataFrame.from_records(rows, columns=COLUMNS)
+
+    def make_game_df(
+        self, gamePk: Union[str, GameContext], verbose: bool = True
+    ) -> "pd.DataFrame":
+        """
+        method that will construct a data frame for a single game given the game id
+
+        Args:
+            gamePk: unique game ID of the game (or its GameContext)
+            verbose: bool indicating if the time taken to build the game is printed
+
+        Returns:
+            game_df: data frame with data points about a specific game
+        """
+        return self.rows_to_df([self.make_game_row(gamePk, verbose=verbose)])
+
+    def get_final_games(
+        self, start_date: str, end_date: str, team: Optional[int] = None
+    ) -> List[GameContext]:
+        """
+        method to get every completed game in a date range
+
+        Args:
+            start_date: first date to get games from (MM/DD/YYYY)
+            end_date: last date to get games from (MM/DD/YYYY)
+            team: team id to get games for (defaults to the entire league)
+
+        Returns:
+            contexts: GameContext of each completed game in date order
+        """
+        start_obj = datetime.strptime(start_date, "%m/%d/%Y")
+        end_obj = datetime.strptime(end_date, "%m/%d/%Y")
+        start_comp = start_obj.strftime("%Y-%m-%d")
+        end_comp = end_obj.strftime("%Y-%m-%d")
+        start_year = int(start_date[-4:])
+        end_year = int(end_date[-4:])
+        games = []
+        for year in range(start_year, end_year + 1):
+            year_start = f"01/01/{year}"
+            year_end = f"12/31/{year}"
+            possible_games = api.schedule(
+                start_date=year_start, end_date=year_end, team=team or ""
+            )
+            games.extend(
+                [
+                    game
+                    for game in possible_games
+                    if game.get("game_type") in GAME_TYPES
+                    and game.get("status") == "Final"
+                    and start_comp <= game["game_date"] <= end_comp
+                ]
+            )
+        # schedule rows already hold everything a GameContext needs
+        return [GameContext(game) for game in games]
+
+    def build_games(
+        self, contexts: List[GameContext], workers: int = 1
+    ) -> List[Dict]:
+        """
+        method to construct the rows of many games
+            -> games are built concurrently across the given number of threads
+            -> statsapi requests stay within the limits of cache.RateLimiter
+
+        Args:
+            contexts: GameContext of each game to construct
+            workers: number of games to construct at the same time
+
+        Returns:
+            rows: row of each game in the same order as contexts
+        """
+        start_time = time.time()
+        rows = []
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            # map yields results in submission order regardless of finish order
+            for row in executor.map(self.make_game_row, contexts):
+                rows.append(row)
+                built = len(rows)
+                if built % PROGRESS_INTERVAL == 0 or built == len(contexts):
+                    elapsed = time.time() - start_time
+                    print(
+                        f"Progress: {built}/{len(contexts)} games "
+                        f"({round(100 * built / len(contexts))}%) "
+                        f"in {round(elapsed, 2)} seconds."
+                    )
+        return rows
+
+    def save_data(self, data: "pd.DataFrame", file_path: str) -> None:
+        """
+        method to save game data to disk
+            -> .parquet files are written with typed (float32) feature columns
+            -> .xlsx sheets are still supported for viewing
+
+        Args:
+            data: data frame in the standard format
+            file_path: path to save data file to (.parquet or .xlsx)
+        """
+        if file_path.endswith(".xlsx"):
+            data.to_excel(file_path, index=False)
+        else:
+            save_games(data, file_path)
 
     def get_data(
         self,
@@ -647,7 +714,8 @@ class LeagueStats:
         end_date: Optional[str] = None,
         file_path: Optional[str] = None,
         save_to_file: Optional[bool] = True,
-    ) -> pd.DataFrame:
+        workers: int = 1,
+    ) -> "pd.DataFrame":
         """
         method to get historical MLB data for the given team and save it to a file
 
@@ -657,6 +725,7 @@ class LeagueStats:
                 -> defaults to current day
             file_path: path to save data file to for persistent storage
             save_to_file: bool indicating if you wish the data to be stored
+            workers: number of games to construct at the same time
 
         Returns:
             data: python dataframe with the requested time range game data
@@ -667,50 +736,61 @@ class LeagueStats:
             formatted_end = end_date.replace("/", "-")
             formatted_start = start_date.replace("/", "-")
             if not file_path:
-                file_path = f"./data/mlb{formatted_start}_{formatted_end}.xlsx"
-        start_obj = datetime.strptime(start_date, "%m/%d/%Y")
-        end_obj = datetime.strptime(end_date, "%m/%d/%Y")
-        start_comp = start_obj.strftime("%Y-%m-%d")
-        end_comp = end_obj.strftime("%Y-%m-%d")
-        start_year = int(start_date[-4:])
-        end_year = int(end_date[-4:])
-        games = []
-        for year in range(start_year, end_year + 1):
-            year_start = f"01/01/{year}"
-            year_end = f"12/31/{year}"
-            possible_games = statsapi.schedule(start_date=year_start, end_date=year_end)
-            games.extend(
-                [
-                    game
-                    for game in possible_games
-                    if game.get("game_type") in ["R", "F", "D", "L", "W", "C", "P"]
-                    and game.get("status") == "Final"
-                    and start_comp <= game["game_date"] <= end_comp
-                ]
-            )
-        ids = [game.get("game_id") for game in games]
-        print(f"Found {str(len(ids))} games in range. Beginning data retrieval!")
-        data = self.declareDf()
-        for game_id in ids:
-            game_df = self.make_game_df(game_id)
-            data = pd.concat([data, game_df], ignore_index=True)
+                file_path = f"./data/mlb{formatted_start}_{formatted_end}.parquet"
+        contexts = self.get_final_games(start_date, end_date)
+        print(f"Found {str(len(contexts))} games in range. Beginning data retrieval!")
+        # rows are assembled into a frame once (concat per game is quadratic)
+        data = self.rows_to_df(self.build_games(contexts, workers))
         if save_to_file:
             try:
-                data.to_excel(file_path, index=False)
+                self.save_data(data, file_path)
                 print(f"Successfully saved data to {file_path}.")
             except Exception as e:
                 print(f"An exception has occured while saving data to disk: {e}")
         return data
 
+    def get_selected_model(
+        self,
+    ) -> Union[Tuple[ModelBundle, None], Tuple[None, str]]:
+        """
+        method to get the model and feature order selected in the .env file
+            -> loaded once by the registry (again only if its files change)
+
+        Returns:
+            bundle: the model's booster, scaler, and feature order
+            None
+
+            or None, <error-msg>
+        """
+        env_file_path = os.path.join(cwd, ".env")
+        load_dotenv(env_file_path)
+
+        model_name = os.getenv("SELECTED_MODEL")
+        if not model_name:
+            return None, "No 'SELECTED_MODEL' found in .env file for retrieval."
+
+        order = os.getenv("FEATURE_ORDER")
+        if not order:
+            return None, "No 'FEATURE_ORDER' found in .env file for retrieval."
+
+        try:
+            return registry.get(model_name, order, ORDERS.get(order)), None
+        except FileNotFoundError:
+            return (
+                None,
+                f"Failed to retrieve model, {model_name}. "
+                f"Ensure it is placed in the models folder",
+            )
+
     def get_array(
-        self, gamePk: str, model_name: str, order: str
+        self, gamePk: Union[str, GameContext], model_name: str, order: str
     ) -> Optional[Union[Tuple[None, str], np.ndarray]]:
         """
         method to get an array of a game's features to make predictions with
             -> specific data augmentation steps described in depth in notebook
 
         Args:
-            gamePk: id of the game to get features from
+            gamePk: id of the game to get features from (or its GameContext)
             model_name: name of the model to be used
                 -> must be valid entry in MODELS
             order: order to put data features in
@@ -718,25 +798,33 @@ class LeagueStats:
         Returns:
             x_pred: features array to give to model
         """
-        with contextlib.redirect_stdout(io.StringIO()):
-            df = self.make_game_df(gamePk)
-        df.drop(
-            columns=["game-id", "date", "home-team", "away-team", "did-home-win"],
-            inplace=True,
+        df = self.make_game_df(gamePk, verbose=False)
+        bundle = registry.get(model_name, order, ORDERS.get(order))
+        x_pred = self.scale_features(df, bundle)
+        return x_pred
+
+    def scale_features(self, df: "pd.DataFrame", bundle: ModelBundle) -> np.ndarray:
+        """
+        method to turn games' data into the scaled features a model takes
+            -> every game (row) is scaled in one scaler.transform call
+
+        Args:
+            df: data frame of games in the standard format (see COLUMNS)
+            bundle: model bundle (from the registry) with the order and scaler
+
+        Returns:
+            x_pred: features array (one row per game) to give to model
+        """
+        import pandas as pd  # type: ignore
+
+        df = df.drop(
+            columns=["game-id", "date", "home-team", "away-team", "did-home-win"]
         )
-        if order == "order1":
-            df = df[order1]
-        elif order == "order2":
-            df = df[order2]
-        scalers = os.path.join(cwd, "models/scalers")
-        path_to_scaler = os.path.join(scalers, (model_name + "_scaler.pkl"))
-        with open(path_to_scaler, "rb") as file:
-            scaler = pickle.load(file)
+        if bundle.columns is not None:
+            df = df[bundle.columns]
         for col in df.columns:
             df[col] = pd.to_numeric(df[col], errors="coerce")
-        df = scaler.transform(df)
-        x_pred = df
-        return x_pred
+        return bundle.scaler.transform(df)
 
     def next_game_array(
         self, team: str, model_name: str, order: str
@@ -761,7 +849,10 @@ class LeagueStats:
         return x_pred
 
     def predict_game(
-        self, gamePk: str, num_simulations=10, perturbation_scale=0.001
+        self,
+        gamePk: Union[str, GameContext],
+        num_simulations=NUM_SIMULATIONS,
+        perturbation_scale=0.001,
     ) -> Optional[Union[Tuple[None, str], Tuple[str, float, Dict]]]:
         """
         method to make prediction on team's next game using specified model
@@ -777,74 +868,145 @@ class LeagueStats:
             or None, <error-msg>
         """
 
-        # retrieve model and order to use from .env
-        env_file_path = os.path.join(cwd, ".env")
-        load_dotenv(env_file_path)
-
-        env_model = os.getenv("SELECTED_MODEL")
-        if not env_model:
-            return None, "No 'SELECTED_MODEL' found in .env file for retrieval."
-        model_name = env_model
-
-        env_order = os.getenv("FEATURE_ORDER")
-        if not env_order:
-            return None, "No 'FEATURE_ORDER' found in .env file for retrieval."
-        order = env_order
+        bundle, error = self.get_selected_model()
+        if bundle is None:
+            return None, error
 
-        x_pred = self.get_array(gamePk, model_name, order)
+        context = self.get_game_context(gamePk)
+        x_pred = self.get_array(context, bundle.name, bundle.order)
 
         if x_pred is None:
             return (
                 None,
                 "Failed to retrieve information about the game.",
             )
-        model_path = os.path.join("./models/", model_name) + ".txt"
-        if not os.path.exists(model_path):
-            return (
-                None,
-                f"Failed to retrieve model, {model_name}. "
-                f"Ensure it is placed in the models folder",
-            )
-        model = lgb.Booster(model_file=model_path)
 
         # simulate multiple predictions with perturbed samples
-        simulated_predictions = []
-        for _ in range(num_simulations):
-            perturbation = np.random.normal(
-                loc=0, scale=perturbation_scale, size=x_pred.shape
-            )
-            perturbed_input = x_pred + perturbation
-            prediction = model.predict(perturbed_input)
-            prediction = float(prediction[0])
-            simulated_predictions.append(prediction)
+        simulated_predictions = self.simulate_predictions(
+            bundle, x_pred, num_simulations, perturbation_scale
+        )[:, 0]
         mean_prediction = np.mean(simulated_predictions)
-        game = statsapi.schedule(game_id=gamePk)[0]
-        if not game:
-            return (
-                None,
-                "Failed to retrieve information about game.",
-            )
-        game_info = {}
-        game_info["datetime"] = game.get("game_datetime")
-        game_info["date"] = game.get("game_date")
-        game_info["away"] = game.get("away_name")
-        game_info["home"] = game.get("home_name")
-        game_info["home"] = game.get("home_name")
-        game_info["home_probable"] = game.get("home_probable_pitcher")
-        game_info["away_probable"] = game.get("away_probable_pitcher")
-        game_info["venue"] = game.get("venue_name")
-        game_info["national_broadcasts"] = game.get("national_broadcasts")
-        game_info["series_status"] = game.get("series_status")
-        game_info["summary"] = game.get("summary")
-        game_info["game_id"] = game.get("game_id")
+        game_info = context.info()
+        game_info.update(self.summarize_simulations(simulated_predictions))
         if mean_prediction >= 0.5:
             winner = game_info["home"]
         else:
             winner = game_info["away"]
         return winner, mean_prediction, game_info
 
+    def predict_games(
+        self,
+        game_ids: List[Union[str, GameContext]],
+        num_simulations=NUM_SIMULATIONS,
+        perturbation_scale=0.001,
+        workers: int = MAX_CONCURRENT_REQUESTS,
+    ) -> List[Union[Tuple[None, str], Tuple[str, float, Dict]]]:
+        """
+        method to make predictions on many games (e.g. a day's slate) at once
+            -> features of every game are scaled together and scored in one call
+
+        Args:
+            game_ids: ids of the games to predict (or their GameContexts)
+            num_simulations: number of perturbed samples made for each game
+            perturbation_scale: standard deviation of the perturbations
+            workers: number of games to build features for at the same time
+
+        Returns:
+            results: one entry per game (in the order of game_ids) of either
+                winner, prediction, game_info (same as predict_game)
+
+                or None, <error-msg>
+        """
+        bundle, error = self.get_selected_model()
+        if bundle is None:
+            return [(None, error) for _ in game_ids]
+
+        def build(gamePk):
+            try:
+                context = self.get_game_context(gamePk)
+                return context, self.make_game_row(context, parallel=True, verbose=False)
+            except Exception as e:
+                return None, f"Failed to retrieve information about game {gamePk}: {e}"
+
+        # every game (and each game's groups of features) is built at the same
+        # time, requests to statsapi stay within the limits of cache.RateLimiter
+        # (rows aren't printed: sys.stdout is shared with the scheduler's other jobs)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            built = list(executor.map(build, game_ids))
+
+        results: List = [None] * len(game_ids)
+        contexts, rows, positions = [], [], []
+        for i, (context, row) in enumerate(built):
+            if context is None:
+                results[i] = (None, row)
+                continue
+            contexts.append(context)
+            rows.append(row)
+            positions.append(i)
+        if not rows:
+            return results
+
+        x_pred = self.scale_features(self.rows_to_df(rows), bundle)
+        predictions = self.simulate_predictions(
+            bundle, x_pred, num_simulations, perturbation_scale
+        )
+        for context, i, simulated in zip(contexts, positions, predictions.T):
+            mean_prediction = np.mean(simulated)
+            game_info = context.info()
+            game_info.update(self.summarize_simulations(simulated))
+            if mean_prediction >= 0.5:
+                winner = game_info["home"]
+            else:
+                winner = game_info["away"]
+            results[i] = (winner, mean_prediction, game_info)
+        return results
+
+    def simulate_predictions(
+        self,
+        bundle: ModelBundle,
+        x_pred: np.ndarray,
+        num_simulations: int,
+        perturbation_scale: float,
+    ) -> np.ndarray:
+        """
+        method to score perturbed copies of games' features
+            -> every perturbed sample of every game is scored in one predict call
+
+        Args:
+            bundle: model bundle (from the registry) with the booster
+            x_pred: features array (one row per game)
+            num_simulations: number of perturbed samples made for each game
+            perturbation_scale: standard deviation of the perturbations
+
+        Returns:
+            predictions: array of shape (num_simulations, number of games)
+        """
+        perturbations = np.random.normal(
+            loc=0, scale=perturbation_scale, size=(num_simulations,) + x_pred.shape
+        )
+        samples = (x_pred[np.newaxis] + perturbations).reshape(-1, x_pred.shape[1])
+        predictions = bundle.booster.predict(samples)
+        return np.asarray(predictions).reshape(num_simulations, x_pred.shape[0])
+
+    def summarize_simulations(self, simulated: np.ndarray) -> Dict:
+        """
+        method to describe the spread of a game's perturbed predictions
+
+        Args:
+            simulated: predictions of a game's perturbed samples
+
+        Returns:
+            summary: python dictionary with the std and quantiles of the predictions
+                -> 'prediction_std', 'prediction_q05', ..., 'prediction_q95'
+        """
+        summary = {"prediction_std": float(np.std(simulated))}
+        values = np.quantile(simulated, QUANTILES)
+        for quantile, value in zip(QUANTILES, values):
+            summary[f"prediction_q{round(quantile * 100):02d}"] = float(value)
+        return summary
+
     def predict_next_game(
-        self, team: str, num_simulations=10, perturbation_scale=0.001
+        self, team: str, num_simulations=NUM_SIMULATIONS, perturbation_scale=0.001
     ) -> Optional[Union[Tuple[None, str], Tuple[str, float, Dict]]]:
         """
         method to make prediction on team's next game using specified model
@@ -860,66 +1022,31 @@ class LeagueStats:
             or None, <error-msg>
         """
 
-        # retrieve model and order to use from .env
-        env_file_path = os.path.join(cwd, ".env")
-        load_dotenv(env_file_path)
-
-        env_model = os.getenv("SELECTED_MODEL")
-        if not env_model:
-            return None, "No 'SELECTED_MODEL' found in .env file for retrieval."
-        model_name = env_model
+        bundle, error = self.get_selected_model()
+        if bundle is None:
+            return None, error
 
-        env_order = os.getenv("FEATURE_ORDER")
-        if not env_order:
-            return None, "No 'FEATURE_ORDER' found in .env file for retrieval."
-        order = env_order
-
-        x_pred = self.next_game_array(team, model_name, order)
-        if x_pred is None:
+        next_game_ret = self.get_next_game(team)
+        if not next_game_ret or not next_game_ret[1]:
             return (
                 None,
                 f"Failed to retrieve information about next game for the {team}.",
             )
-        model_path = os.path.join("./models/", model_name) + ".txt"
-        if not os.path.exists(model_path):
+        context = GameContext(next_game_ret[1])
+        x_pred = self.get_array(context, bundle.name, bundle.order)
+        if x_pred is None:
             return (
                 None,
-                f"Failed to retrieve model, {model_name}. "
-                f"Ensure it is placed in the models folder",
+                f"Failed to retrieve information about next game for the {team}.",
             )
-        model = lgb.Booster(model_file=model_path)
 
         # simulate multiple predictions with perturbed samples
-        simulated_predictions = []
-        for _ in range(num_simulations):
-            perturbation = np.random.normal(
-                loc=0, scale=perturbation_scale, size=x_pred.shape
-            )
-            perturbed_input = x_pred + perturbation
-            prediction = model.predict(perturbed_input)
-            prediction = float(prediction[0])
-            simulated_predictions.append(prediction)
+        simulated_predictions = self.simulate_predictions(
+            bundle, x_pred, num_simulations, perturbation_scale
+        )[:, 0]
         mean_prediction = np.mean(simulated_predictions)
-        next_game_ret = self.get_next_game(team)
-        if not next_game_ret or not next_game_ret[1]:
-            return (
-                None,
-                f"Failed to retrieve information about next game for the {team}.",
-            )
-        next_game = next_game_ret[1]
-        game_info = {}
-        game_info["datetime"] = next_game["game_datetime"]
-        game_info["date"] = next_game["game_date"]
-        game_info["away"] = next_game["away_name"]
-        game_info["home"] = next_game["home_name"]
-        game_info["home"] = next_game["home_name"]
-        game_info["home_probable"] = next_game["home_probable_pitcher"]
-        game_info["away_probable"] = next_game["away_probable_pitcher"]
-        game_info["venue"] = next_game["venue_name"]
-        game_info["national_broadcasts"] = next_game["national_broadcasts"]
-        game_info["series_status"] = next_game["series_status"]
-        game_info["summary"] = next_game["summary"]
-        game_info["game_id"] = next_game["game_id"]
+        game_info = context.info()
+        game_info.update(self.summarize_simulations(simulated_predictions))
         if mean_prediction >= 0.5:
             winner = game_info["home"]
         else:
@@ -928,11 +1055,11 @@ class LeagueStats:
 
 
 class TeamStats(LeagueStats):
-    def __init__(self, team: str):
-        self.retrieve_ids(IDS)
+    def __init__(self, team: str, as_of_stats: bool = False):
+        self.as_of_stats = as_of_stats
         self.name = team
-        self.abbreviation = team_to_abbreviation[self.name]
-        self.id = team_to_id[self.name]
+        self.abbreviation = teams.team_to_abbreviation[self.name]
+        self.id = teams.team_to_id[self.name]
         div = self.get_division(self.name)
         if div:
             self.divisionName, self.divisionId = div
@@ -963,8 +1090,8 @@ class TeamStats(LeagueStats):
             gamePk: id of the team's next to-be-played game
             schedule: python dictionary with game details
         """
-        gamePk = statsapi.next_game(self.id)
-        next = statsapi.schedule(game_id=gamePk)
+        gamePk = api.next_game(self.id)
+        next = api.schedule(game_id=gamePk)
         return gamePk, next[0]
 
     def get_last_game(self) -> Optional[Union[Tuple[str, Dict], Tuple[None, None]]]:
@@ -975,8 +1102,8 @@ class TeamStats(LeagueStats):
             gamePk: id of the team's next to-be-played game
             schedule: python dictionary with game details
         """
-        gamePk = statsapi.last_game(self.id)
-        next = statsapi.schedule(game_id=gamePk)
+        gamePk = api.last_game(self.id)
+        next = api.schedule(game_id=gamePk)
         return gamePk, next[0]
 
     def get_data(
@@ -985,7 +1112,8 @@ class TeamStats(LeagueStats):
         end_date: Optional[str] = None,
         file_path: Optional[str] = None,
         save_to_file: Optional[bool] = True,
-    ) -> pd.DataFrame:
+        workers: int = 1,
+    ) -> "pd.DataFrame":
         """
         method to get historical MLB data for the given team and save it to a file
 
@@ -995,6 +1123,7 @@ class TeamStats(LeagueStats):
                 -> defaults to current day
             file_path: path to save data file to for persistent storage
             save_to_file: bool indicating if you wish the data to be stored
+            workers: number of games to construct at the same time
 
         Returns:
             data: python dataframe with the requested time range game data
@@ -1006,39 +1135,15 @@ class TeamStats(LeagueStats):
             formatted_start = start_date.replace("/", "-")
             if not file_path:
                 file_path = (
-                    f"./data/{self.abbreviation}_{formatted_start}_{formatted_end}.xlsx"
+                    f"./data/{self.abbreviation}_{formatted_start}_{formatted_end}.parquet"
                 )
-        start_obj = datetime.strptime(start_date, "%m/%d/%Y")
-        end_obj = datetime.strptime(end_date, "%m/%d/%Y")
-        start_comp = start_obj.strftime("%Y-%m-%d")
-        end_comp = end_obj.strftime("%Y-%m-%d")
-        start_year = int(start_date[-4:])
-        end_year = int(end_date[-4:])
-        games = []
-        for year in range(start_year, end_year + 1):
-            year_start = f"01/01/{year}"
-            year_end = f"12/31/{year}"
-            possible_games = statsapi.schedule(
-                start_date=year_start, end_date=year_end, team=self.id
-            )
-            games.extend(
-                [
-                    game
-                    for game in possible_games
-                    if game.get("game_type") in ["R", "F", "D", "L", "W", "C", "P"]
-                    and game.get("status") == "Final"
-                    and start_comp <= game["game_date"] <= end_comp
-                ]
-            )
-        ids = [game.get("game_id") for game in games]
-        print(f"Found {str(len(ids))} games in range. Beginning data retrieval!")
-        data = self.declareDf()
-        for game_id in ids:
-            game_df = self.make_game_df(game_id)
-            data = pd.concat([data, game_df], ignore_index=True)
+        contexts = self.get_final_games(start_date, end_date, team=self.id)
+        print(f"Found {str(len(contexts))} games in range. Beginning data retrieval!")
+        # rows are assembled into a frame once (concat per game is quadratic)
+        data = self.rows_to_df(self.build_games(contexts, workers))
         if save_to_file:
             try:
-                data.to_excel(file_path, index=False)
+                self.save_data(data, file_path)
                 print(f"Successfully saved data to {file_path}.")
             except Exception as e:
                 print(f"An exception has occured while saving data to disk: {e}")
@@ -1,10 +1,15 @@
 #!/usr/bin/python3
 
 from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from store import SEASONS_DIR, append_games, stored_game_ids
 from data import LeagueStats, TeamStats
 import calendar
 import os
 
+# number of games built at the same time during retrieval
+WORKERS = 8
+
 teams = {
     "Oakland Athletics": "OAK",
     "Pittsburgh Pirates": "PIT",
@@ -63,35 +68,97 @@ def split_date_range(start_date, end_date):
 
 
 def generate_file_path(year, month, index):
-    return f"data/seasons/{year}/{month}_{index}.xlsx"
-
-
-def retrieve_data(start_date, end_date, team_name="mlb"):
+    return os.path.join(SEASONS_DIR, f"{year}/{month}_{index}.parquet")
+
+
+def half_month_file_path(game_date: datetime) -> str:
+    """returns the file a game is ingested into (first or second half of month)"""
+    index = 1 if game_date.day <= 15 else 2
+    return generate_file_path(game_date.year, game_date.strftime("%B").lower(), index)
+
+
+def ingest_games(
+    data_object: LeagueStats,
+    start_date: str,
+    end_date: str,
+    file_path: Optional[str] = None,
+    workers: int = WORKERS,
+) -> int:
+    """
+    function to build and store only the completed games that aren't stored yet
+        -> games are matched by game-id so running it again adds nothing
+
+    Args:
+        data_object: LeagueStats (or TeamStats) instance used to build games
+        start_date: first date to ingest games from (MM/DD/YYYY)
+        end_date: last date to ingest games from (MM/DD/YYYY)
+        file_path: file to add games to (defaults to each game's half-month file)
+        workers: number of games to construct at the same time
+
+    Returns:
+        num_games: number of games added to the store
+    """
+    team = data_object.id if isinstance(data_object, TeamStats) else None
+    stored = stored_game_ids()
+    contexts = [
+        context
+        for context in data_object.get_final_games(start_date, end_date, team=team)
+        if int(context.id) not in stored
+    ]
+    if not contexts:
+        return 0
+    rows = data_object.build_games(contexts, workers)
+    rows_by_file: Dict[str, List[Dict]] = {}
+    for context, row in zip(contexts, rows):
+        path = file_path or half_month_file_path(context.date)
+        rows_by_file.setdefault(path, []).append(row)
+    for path, file_rows in rows_by_file.items():
+        append_games(data_object.rows_to_df(file_rows), path)
+    return len(rows)
+
+
+def ingest_new_games(through_date: Optional[datetime] = None, workers=WORKERS):
+    """
+    function to add completed games of the current season missing from the store
+        -> scheduled nightly from main.py, so usually only yesterday's games
+
+    Args:
+        through_date: last date to ingest games from (defaults to yesterday)
+        workers: number of games to construct at the same time
+    """
+    end = through_date or (datetime.now() - timedelta(days=1))
+    start = end.replace(month=1, day=1)
+    num_games = ingest_games(
+        LeagueStats(),
+        start.strftime("%m/%d/%Y"),
+        end.strftime("%m/%d/%Y"),
+        workers=workers,
+    )
+    print(f"Ingested {num_games} new games through {end.strftime('%m/%d/%Y')}.")
+
+
+def retrieve_data(start_date, end_date, team_name="mlb", workers=WORKERS):
     intervals = split_date_range(start_date, end_date)
     if team_name == "mlb":
         data_object = LeagueStats()
     else:
         data_object = TeamStats(team_name)
 
-    for index, (interval_start, interval_end) in enumerate(intervals):
-        file_path = generate_file_path(
-            interval_start.year, interval_start.strftime("%B").lower(), index + 1
-        )
-
-        if os.path.isfile(file_path):
-            print(
-                f"Skipping data retrieval for {interval_start.strftime('%B %Y')}"
-                f"(already exists)"
-            )
-            continue
+    for interval_start, interval_end in intervals:
+        # same half-month file the nightly ingest writes the interval's games to
+        file_path = half_month_file_path(interval_start)
 
+        # only games missing from the store are built (even if the file exists)
+        num_games = 0
         success = False
         while not success:
             try:
-                data_object.get_data(
+                num_games = ingest_games(
+                    data_object,
                     start_date=interval_start.strftime("%m/%d/%Y"),
                     end_date=interval_end.strftime("%m/%d/%Y"),
                     file_path=file_path,
+                    workers=workers,
                 )
                 success = True
             except Exception as e:
@@ -102,7 +169,10 @@ def retrieve_data(start_date, end_date, team_name="mlb"):
                 )
                 print("Retrying...")
 
-        print(f"\nData retrieved for {interval_start.strftime('%B %Y')}\n")
+        print(
+            f"\nData retrieved for {interval_start.strftime('%B %Y')} "
+            f"({num_games} new games)\n"
+        )
 
     print("Data retrieval complete.")
 
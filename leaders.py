@@ -0,0 +1,138 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from cache import api, IMMUTABLE, DAILY_TTL, MAX_CONCURRENT_REQUESTS
+from teams import teams
+import threading
+
+# leader categories used for data and the name each has in a feature
+# (e.g. "home-top5-hr-avg")
+CATEGORIES = {
+    "homeRuns": "hr",
+    "runsBattedIn": "rbi",
+    "battingAverage": "batting",
+    "stolenBases": "stolenBases",
+    "totalBases": "totalBases",
+}
+
+TOP_N = 5
+
+
+class TeamLeaders:
+    """
+    every team's stat leaders keyed by (team id, season, day)
+        -> one request per team gets every category at once
+        -> the first request of a day loads all teams in one bulk pass
+        -> past seasons are keyed without a day as their leaders never change
+    """
+
+    def __init__(self, workers: int = MAX_CONCURRENT_REQUESTS):
+        self.workers = workers
+        self.leaders: Dict[Tuple[int, str, Optional[date]], Dict[str, List]] = {}
+        self.loaded: Set[Tuple[str, Optional[date]]] = set()
+        self.lock = threading.Lock()
+        # held while checking for (and running) a bulk pass so only one runs
+        self.load_lock = threading.Lock()
+
+    def _day(self, season: str) -> Optional[date]:
+        """leaders of the current season change daily, past seasons never do"""
+        today = date.today()
+        return today if int(season) >= today.year else None
+
+    def fetch(self, team_id: int, season: str) -> Dict[str, List]:
+        """
+        method to request a team's leaders in every category with one call
+
+        Args:
+            team_id: id of the team
+            season: season to get leaders for (e.g. "2023")
+
+        Returns:
+            leaders: {category: leaders' values ordered by rank}
+        """
+        response = api.get(
+            "team_leaders",
+            {
+                "teamId": team_id,
+                "leaderCategories": ",".join(CATEGORIES),
+                "season": season,
+                "leaderGameTypes": "R",
+                "limit": 10,
+                "fields": "teamLeaders,leaderCategory,leaders,rank,value",
+            },
+            ttl=DAILY_TTL if self._day(season) else IMMUTABLE,
+        )
+        leaders: Dict[str, List] = {}
+        for category in response.get("teamLeaders", []):
+            # same as statsapi.team_leader_data, the first entry of a category is used
+            name = category.get("leaderCategory")
+            if name in CATEGORIES and name not in leaders:
+                leaders[name] = [player["value"] for player in category["leaders"]]
+        return leaders
+
+    def load_all(self, season: str, ids: Optional[Iterable[int]] = None) -> None:
+        """
+        method to load the leaders of every team for a season in one bulk pass
+
+        Args:
+            season: season to get leaders for (e.g. "2023")
+            ids: ids of the teams to load (defaults to every team)
+        """
+        day = self._day(season)
+        ids = list(ids) if ids is not None else teams.ids()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            fetched = executor.map(lambda team_id: self.fetch(team_id, season), ids)
+            for team_id, leaders in zip(ids, fetched):
+                with self.lock:
+                    self.leaders[(team_id, season, day)] = leaders
+        with self.lock:
+            self.loaded.add((season, day))
+
+    def team(self, team_id: int, season: str) -> Dict[str, List]:
+        """
+        method to get a team's leaders for a season
+
+        Args:
+            team_id: id of the team
+            season: season to get leaders for (e.g. "2023")
+
+        Returns:
+            leaders: {category: leaders' values ordered by rank}
+        """
+        team_id, season = int(team_id), str(season)
+        day = self._day(season)
+        with self.load_lock:
+            if (season, day) not in self.loaded:
+                self.load_all(season)
+        key = (team_id, season, day)
+        if key not in self.leaders:
+            # a team missing from the team directory is fetched by itself
+            leaders = self.fetch(team_id, season)
+            with self.lock:
+                self.leaders[key] = leaders
+        return self.leaders[key]
+
+    def top_averages(self, team_id: int, season: str) -> Dict[str, Optional[float]]:
+        """
+        method to get a team's average among its top 5 players in each category
+            -> uses last season's leaders if the team has none yet this season
+
+        Args:
+            team_id: id of the team
+            season: season to get leaders for (e.g. "2023")
+
+        Returns:
+            averages: {feature name (e.g. "hr"): average of the top 5 values}
+        """
+        leaders = self.team(team_id, season)
+        if not any(leaders.values()):
+            leaders = self.team(team_id, str(int(season) - 1))
+        averages: Dict[str, Optional[float]] = {}
+        for category, name in CATEGORIES.items():
+            top = [float(value) for value in leaders.get(category, [])[:TOP_N]]
+            averages[name] = sum(top) / len(top) if top else None
+        return averages
+
+
+# shared leaders used by data.py
+team_leaders = TeamLeaders()
@@ -0,0 +1,313 @@
+#!/usr/bin/python3
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+from datetime import date, datetime
+from dotenv import load_dotenv  # type: ignore
+import contextlib
+import sqlite3
+import sys
+import os
+
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore
+
+cwd = os.path.dirname(os.path.abspath(__file__))
+
+# sqlite database every prediction is kept in
+LEDGER_PATH = os.path.join(cwd, "data/predictions.db")
+
+# columns of a prediction (in the order of the old predictions sheet) and their
+# sqlite types (numbers are stored as numbers so odds and scores read back as ints)
+COLUMNS = {
+    "prediction_accuracy": "REAL",
+    "date": "TEXT",
+    "time": "TEXT",
+    "home": "TEXT",
+    "home_probable": "TEXT",
+    "away": "TEXT",
+    "away_probable": "TEXT",
+    "predicted_winner": "TEXT",
+    "model": "TEXT",
+    "favorite": "TEXT",
+    "home_odds": "INTEGER",
+    "home_odds_bookmaker": "TEXT",
+    "away_odds": "INTEGER",
+    "away_odds_bookmaker": "TEXT",
+    "home_score": "INTEGER",
+    "away_score": "INTEGER",
+    "winning_pitcher": "TEXT",
+    "losing_pitcher": "TEXT",
+    "prediction_value": "REAL",
+    "venue": "TEXT",
+    "series_status": "TEXT",
+    "national_broadcasts": "TEXT",
+    "odds_retrieval_time": "TEXT",
+    "prediction_generation_time": "TEXT",
+    "datetime": "TEXT",
+    "game_id": "INTEGER NOT NULL UNIQUE",
+    "summary": "TEXT",
+    "tweet": "TEXT",
+    "time_to_tweet": "TEXT",
+    "tweeted?": "INTEGER",
+}
+
+INDEXES = {
+    "predictions_date": ["date"],
+    "predictions_tweeted": ["tweeted?", "date"],
+    "predictions_tweet": ["tweet"],
+    "predictions_unchecked": ["prediction_accuracy"],
+}
+
+
+def get_data_path() -> str:
+    """
+    function that will fetch the predictions sheet path from .env file
+        -> the sheet is only used to export (or import) predictions
+
+    Returns:
+        str: path to the data sheet from the same directory as the .env file
+    """
+    env_file_path = os.path.join(cwd, ".env")
+    load_dotenv(env_file_path)
+    data_sheet = os.getenv("DATA_SHEET_PATH")
+    return data_sheet if data_sheet is not None else "data/predictions.xlsx"
+
+
+def quote(column: str) -> str:
+    """function to quote a column name for sql (e.g. "tweeted?")"""
+    return '"' + column.replace('"', '""') + '"'
+
+
+def to_sql_value(value: Any) -> Any:
+    """
+    function to convert a value from a prediction into one sqlite can store
+
+    Args:
+        value: value of a prediction's column
+
+    Returns:
+        value: None, int, float, or str
+    """
+    # pandas and numpy are imported when needed so marking tweets stays light
+    import pandas as pd  # type: ignore
+    import numpy as np  # type: ignore
+
+    if value is None:
+        return None
+    if isinstance(value, (bool, np.bool_)):
+        return int(value)
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    if value is pd.NaT:
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.isoformat(sep=" ") if isinstance(value, datetime) else str(value)
+    if isinstance(value, (int, float, str)):
+        return value
+    return str(value)
+
+
+class PredictionLedger:
+    """
+    every prediction made, one row per game in a sqlite database
+        -> indexed on game_id, date and tweeted status
+        -> rows are updated in place instead of rewriting a whole sheet
+        -> an existing predictions sheet is imported when the database is created
+    """
+
+    def __init__(self, db_path: str = LEDGER_PATH):
+        self.db_path = db_path
+
+    @contextlib.contextmanager
+    def connect(self):
+        """context manager of a connection (committed when the block exits)"""
+        is_new = not os.path.isfile(self.db_path)
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            if is_new:
+                self.create(connection)
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def create(self, connection: sqlite3.Connection) -> None:
+        """
+        method to create the predictions table (and import the old sheet if any)
+
+        Args:
+            connection: connection to the new database
+        """
+        columns = ", ".join(f"{quote(col)} {kind}" for col, kind in COLUMNS.items())
+        with connection:
+            connection.execute(f"CREATE TABLE IF NOT EXISTS predictions ({columns})")
+            for name, cols in INDEXES.items():
+                connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {name} ON predictions "
+                    f"({', '.join(quote(col) for col in cols)})"
+                )
+        sheet = os.path.join(cwd, get_data_path())
+        if os.path.isfile(sheet):
+            import pandas as pd  # type: ignore
+
+            df = pd.read_excel(sheet)
+            df["date"] = pd.to_datetime(df["date"]).dt.date.astype(str)
+            rows = df.to_dict("records")
+            self.insert(connection, rows)
+            print(f"Imported {len(rows)} predictions from {sheet} into {self.db_path}.")
+
+    def insert(self, connection: sqlite3.Connection, predictions: List[Dict]) -> None:
+        """method to insert (or replace) predictions using an open connection"""
+        cols = list(COLUMNS)
+        sql = (
+            f"INSERT OR REPLACE INTO predictions ({', '.join(quote(c) for c in cols)}) "
+            f"VALUES ({', '.join('?' for _ in cols)})"
+        )
+        with connection:
+            connection.executemany(
+                sql,
+                [[to_sql_value(row.get(col)) for col in cols] for row in predictions],
+            )
+
+    def add(self, predictions: List[Dict]) -> None:
+        """
+        method to save new predictions (a game already saved is replaced)
+
+        Args:
+            predictions: python dictionaries with a prediction's info (see COLUMNS)
+        """
+        with self.connect() as connection:
+            self.insert(connection, predictions)
+
+    def update(self, game_id: int, values: Dict) -> None:
+        """
+        method to update some of the columns of a single prediction
+
+        Args:
+            game_id: id of the game predicted
+            values: {column: new value}
+        """
+        self.update_many({game_id: values})
+
+    def update_many(self, updates: Dict[int, Dict]) -> None:
+        """
+        method to update the columns of many predictions in one transaction
+
+        Args:
+            updates: {game_id: {column: new value}}
+        """
+        with self.connect() as connection:
+            for game_id, values in updates.items():
+                values = {col: value for col, value in values.items() if col in COLUMNS}
+                if not values:
+                    continue
+                assignments = ", ".join(f"{quote(col)} = ?" for col in values)
+                connection.execute(
+                    f"UPDATE predictions SET {assignments} WHERE game_id = ?",
+                    [to_sql_value(value) for value in values.values()] + [int(game_id)],
+                )
+
+    def query(self, where: str = "", params: Iterable = ()) -> "pd.DataFrame":
+        """
+        method to read predictions into a data frame (in the order they were saved)
+
+        Args:
+            where: sql condition of the rows to read (empty for every row)
+            params: parameters of the condition
+
+        Returns:
+            df: data frame with the matching predictions
+        """
+        import pandas as pd  # type: ignore
+
+        sql = "SELECT * FROM predictions" + (f" WHERE {where}" if where else "")
+        with self.connect() as connection:
+            return pd.read_sql_query(sql + " ORDER BY rowid", connection, params=list(params))
+
+    def get(self, game_id: int) -> Optional["pd.Series"]:
+        """
+        method to get a single prediction
+
+        Args:
+            game_id: id of the game predicted
+
+        Returns:
+            row: pandas series with the prediction's info or None if not found
+        """
+        df = self.query("game_id = ?", [int(game_id)])
+        return df.iloc[0] if len(df) else None
+
+    def on_date(self, day: date, tweeted: Optional[bool] = None) -> "pd.DataFrame":
+        """
+        method to get the predictions of games on a given day
+
+        Args:
+            day: date of the games
+            tweeted: only predictions that were (True) or weren't (False) tweeted
+
+        Returns:
+            df: data frame with the predictions
+        """
+        if tweeted is None:
+            return self.query("date = ?", [str(day)])
+        return self.query(
+            f"date = ? AND COALESCE({quote('tweeted?')}, 0) = ?", [str(day), int(tweeted)]
+        )
+
+    def unchecked(self) -> "pd.DataFrame":
+        """method to get the predictions that haven't been checked for accuracy"""
+        return self.query("prediction_accuracy IS NULL")
+
+    def mark_tweeted(self, lines: List[str]) -> int:
+        """
+        method to mark the predictions with the given tweet lines as tweeted
+
+        Args:
+            lines: tweet lines of the predictions
+
+        Returns:
+            num_marked: number of predictions marked
+        """
+        if not lines:
+            return 0
+        with self.connect() as connection:
+            cursor = connection.execute(
+                f"UPDATE predictions SET {quote('tweeted?')} = 1 "
+                f"WHERE tweet IN ({', '.join('?' for _ in lines)})",
+                list(lines),
+            )
+            return cursor.rowcount
+
+    def export_excel(self, file_path: Optional[str] = None) -> str:
+        """
+        method to write every prediction to an excel sheet (for reporting)
+
+        Args:
+            file_path: path of the .xlsx to write (defaults to DATA_SHEET_PATH)
+
+        Returns:
+            file_path: path of the sheet written
+        """
+        file_path = file_path or os.path.join(cwd, get_data_path())
+        df = self.query()
+        df["tweeted?"] = df["tweeted?"].astype("boolean")
+        df.to_excel(file_path, index=False)
+        print(f"Exported {len(df)} predictions to {file_path}.")
+        return file_path
+
+
+# shared ledger used by predict.py and server/prep_tweet.py
+ledger = PredictionLedger()
+
+
+if __name__ == "__main__":
+    # usage: python3 ledger.py export [path/to/sheet.xlsx]
+    if len(sys.argv) < 2 or sys.argv[1] != "export":
+        print("usage: python3 ledger.py export [path/to/sheet.xlsx]")
+        sys.exit(1)
+    ledger.export_excel(sys.argv[2] if len(sys.argv) > 2 else None)
@@ -1,10 +1,19 @@
-from apscheduler.events import EVENT_SCHEDULER_STARTED, EVENT_JOB_EXECUTED  # type: ignore
-from apscheduler.schedulers.blocking import BlockingScheduler  # type: ignore
+from apscheduler.events import (  # type: ignore
+    EVENT_SCHEDULER_STARTED,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_ERROR,
+    EVENT_JOB_MISSED,
+)
+from apscheduler.schedulers.asyncio import AsyncIOScheduler  # type: ignore
+from apscheduler.triggers.interval import IntervalTrigger  # type: ignore
 from apscheduler.triggers.cron import CronTrigger  # type: ignore
-from predict import check_and_predict
+from data_retriever import ingest_new_games
+from predict import load_unchecked_predictions, predict_and_queue
+from server.get_odds import make_request
+from server.outbox import outbox
 from dotenv import load_dotenv  # type: ignore
 from datetime import datetime
-import time
+import asyncio
 import pytz  # type: ignore
 import os
 
@@ -18,38 +27,104 @@ selected_model = ret if ret is not None else selected_model
 
 eastern = pytz.timezone("America/New_York")
 
+# seconds between checks of the outbox for tweets that are due
+PUBLISH_INTERVAL = 15
+
 
 def print_next_job(event) -> None:
     """function to print details about next scheduled job"""
-    time.sleep(1)
-    next_job = scheduler.get_jobs()[0] if scheduler.get_jobs()[0] else None
-    if next_job is not None:
-        print(
-            f"{datetime.now(eastern).strftime('%D - %I:%M:%S %p')}... "
-            f"Next Scheduled Job"
-        )
-        print(f"Job Name: {next_job.name}")
-        run_time = next_job.next_run_time
-        et_time = run_time.astimezone(eastern)
-        formatted_time = et_time.strftime("%I:%M %p")
-        print(f"Next Execution Time: {formatted_time} ET")
-        time.sleep(1)
-    return
-
-
-scheduler = BlockingScheduler()
-scheduler.add_listener(print_next_job, EVENT_SCHEDULER_STARTED)
-scheduler.add_listener(print_next_job, EVENT_JOB_EXECUTED)
-
-task_time = datetime.now().replace(hour=9, minute=30, second=0, microsecond=0)
-scheduler.add_job(
-    check_and_predict,
-    trigger=CronTrigger(
-        hour=task_time.hour, minute=task_time.minute, second=task_time.second
+    if getattr(event, "job_id", None) == "publish":
+        # the outbox is checked every few seconds, so its runs aren't announced
+        return
+    # the outbox check is always next, so announce the next of the other jobs
+    jobs = [
+        job
+        for job in scheduler.get_jobs()
+        if job.next_run_time is not None and job.id != "publish"
+    ]
+    if not jobs:
+        return
+    next_job = min(jobs, key=lambda job: job.next_run_time)
+    print(
+        f"{datetime.now(eastern).strftime('%D - %I:%M:%S %p')}... "
+        f"Next Scheduled Job"
     )
-)
+    print(f"Job Name: {next_job.name}")
+    et_time = next_job.next_run_time.astimezone(eastern)
+    formatted_time = et_time.strftime("%I:%M %p")
+    print(f"Next Execution Time: {formatted_time} ET")
+
+
+def print_job_error(event) -> None:
+    """function to print the error of a job that failed (the other jobs carry on)"""
+    print(
+        f"{datetime.now(eastern).strftime('%D - %I:%M:%S %p')}... "
+        f"\nJob {event.job_id} failed: {event.exception}\n"
+    )
+
+
+def create_scheduler() -> AsyncIOScheduler:
+    """
+    function to create the scheduler running every job of the bot
+        -> each stage is its own job so a slow or failing stage doesn't hold up
+           the others (jobs run in the event loop's thread pool)
+        -> odds are refreshed just before predicting so predictions reuse them
+
+    Returns:
+        scheduler: scheduler with every job added (not started)
+    """
+    scheduler = AsyncIOScheduler(
+        job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": 3600}
+    )
+    scheduler.add_listener(print_next_job, EVENT_SCHEDULER_STARTED)
+    scheduler.add_listener(print_next_job, EVENT_JOB_EXECUTED | EVENT_JOB_MISSED)
+    scheduler.add_listener(print_job_error, EVENT_JOB_ERROR)
+
+    # check yesterday's predictions and tweet the results
+    scheduler.add_job(
+        load_unchecked_predictions,
+        trigger=CronTrigger(hour=9, minute=30, second=0),
+        id="check_results",
+    )
+    # store a fresh odds snapshot for the predict job to read
+    scheduler.add_job(
+        make_request,
+        trigger=CronTrigger(hour=9, minute=25, second=0),
+        id="refresh_odds",
+    )
+    # predict today's games and queue the prediction tweets for 9:45
+    scheduler.add_job(
+        predict_and_queue,
+        trigger=CronTrigger(hour=9, minute=30, second=0),
+        id="predict",
+    )
+    # send queued tweets as they become due (and any left from before a restart)
+    scheduler.add_job(
+        outbox.drain,
+        trigger=IntervalTrigger(seconds=PUBLISH_INTERVAL),
+        id="publish",
+        next_run_time=datetime.now(),
+    )
+    # add yesterday's completed games to the training data each night
+    scheduler.add_job(
+        ingest_new_games,
+        trigger=CronTrigger(hour=4, minute=0, second=0),
+        id="ingest_new_games",
+    )
+    return scheduler
+
+
+async def run() -> None:
+    """function to start the scheduler and run until the process is stopped"""
+    global scheduler
+    # created here so the scheduler uses the running event loop
+    scheduler = create_scheduler()
+    scheduler.start()
+    await asyncio.Event().wait()
+
 
-time.sleep(1)
+# define scheduler as global var (set by run)
+scheduler = None
 
-# start the scheduler
-scheduler.start()
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -0,0 +1,155 @@
+from typing import Dict, Optional, Tuple
+from datetime import date
+from cache import api, IMMUTABLE, DAILY_TTL, MISS
+import threading
+
+
+class PitcherRepository:
+    """
+    starting pitcher ids and stat lines shared by every game a pitcher starts
+        -> name to id resolution is cached per (name, season) once it finds the
+           player (a player not found yet, e.g. a call-up, is looked up again)
+        -> season (yearByYear) and career stat lines are cached per player id for
+           the day (they include the current season, so they're fetched again the
+           next day, through api's DAILY_TTL)
+        -> season stats can be taken as of a date so historical rows
+           don't include games played after them
+    """
+
+    def __init__(self):
+        self.ids: Dict[Tuple[str, Optional[str]], int] = {}
+        self.seasons: Dict[int, Dict[str, Dict]] = {}
+        self.careers: Dict[int, Optional[Dict]] = {}
+        self.as_of: Dict[Tuple[int, str, date], Dict] = {}
+        # day the season and career stat lines were cached on
+        self.day: Optional[date] = None
+        self.lock = threading.Lock()
+
+    def _day(self) -> date:
+        """
+        method to get today's date
+            -> stat lines cached on an earlier day (and as-of lines that could
+               still change then) are dropped so a long-running process sees
+               the current season's new games
+        """
+        today = date.today()
+        with self.lock:
+            if self.day != today:
+                self.seasons.clear()
+                self.careers.clear()
+                self.as_of = {key: stats for key, stats in self.as_of.items() if key[2] < today}
+                self.day = today
+        return today
+
+    def player_id(self, player_name: str, season: Optional[str] = None) -> Optional[int]:
+        """
+        method that will get the id of a player given their name
+
+        Args:
+            player_name: a player's name in plain english
+            season: season to search for player within
+
+        Returns:
+            player_id: a player's id for use with the api as a parameter
+        """
+        key = (player_name, season)
+        player_id = self.ids.get(key)
+        if player_id is None:
+            player = api.lookup_player(player_name, season=season)
+            player_id = player[0].get("id") if player else None
+            if player_id is not None:
+                with self.lock:
+                    self.ids[key] = player_id
+        return player_id
+
+    def season_stats(
+        self, player_id: int, season: str, as_of: Optional[date] = None
+    ) -> Dict:
+        """
+        method to get a pitcher's stat line for a season
+
+        Args:
+            player_id: id of the pitcher
+            season: season to get stats for (e.g. "2023")
+            as_of: last date to include games from (defaults to the whole season)
+
+        Returns:
+            season_stats: python dictionary of stats (empty if none that season)
+        """
+        if as_of is not None:
+            return self.season_stats_as_of(player_id, season, as_of)
+        self._day()
+        by_season = self.seasons.get(player_id)
+        if by_season is None:
+            seasons = api.player_stat_data(
+                player_id, group="pitching", type="yearByYear"
+            ).get("stats")
+            by_season = {}
+            # a season split across teams has one entry per team (last one is kept)
+            for year in seasons or []:
+                by_season[year["season"]] = year["stats"]
+            with self.lock:
+                self.seasons[player_id] = by_season
+        return by_season.get(season, {})
+
+    def season_stats_as_of(self, player_id: int, season: str, as_of: date) -> Dict:
+        """
+        method to get a pitcher's stat line for a season through a given date
+
+        Args:
+            player_id: id of the pitcher
+            season: season to get stats for (e.g. "2023")
+            as_of: last date to include games from
+
+        Returns:
+            season_stats: python dictionary of stats (empty if no games by then)
+        """
+        key = (player_id, season, as_of)
+        today = self._day()
+        cached = self.as_of.get(key)
+        if cached is not None:
+            return cached
+        hydrate = (
+            f"stats(group=[pitching],type=[byDateRange],"
+            f"startDate=01/01/{season},endDate={as_of.strftime('%m/%d/%Y')},"
+            f"season={season})"
+        )
+        people = api.get(
+            "people",
+            {"personIds": player_id, "hydrate": hydrate},
+            ttl=IMMUTABLE if as_of < today else DAILY_TTL,
+        ).get("people")
+        splits = []
+        for stats in (people[0].get("stats", []) if people else []):
+            splits.extend(stats.get("splits", []))
+        # prefer the combined split when a pitcher was traded during the season
+        combined = [split for split in splits if "team" not in split]
+        split = (combined or splits or [{}])[0]
+        stat = split.get("stat", {})
+        with self.lock:
+            self.as_of[key] = stat
+        return stat
+
+    def career_stats(self, player_id: int) -> Optional[Dict]:
+        """
+        method to get a pitcher's career stat line
+
+        Args:
+            player_id: id of the pitcher
+
+        Returns:
+            career_stats: python dictionary of stats or None if there are none
+        """
+        self._day()
+        cached = self.careers.get(player_id, MISS)
+        if cached is not MISS:
+            return cached
+        career = api.player_stat_data(player_id, group="pitching", type="career")["stats"]
+        career_stats = career[0]["stats"] if career else None
+        with self.lock:
+            self.careers[player_id] = career_stats
+        return career_stats
+
+
+# shared repository used by data.py
+pitchers = PitcherRepository()
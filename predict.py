@@ -1,24 +1,21 @@
 from server.tweet_generator import gen_result_tweet, gen_game_line, create_tweets
-from apscheduler.schedulers.background import BlockingScheduler  # type: ignore
-from apscheduler.events import (
-    EVENT_SCHEDULER_STARTED,
-    EVENT_JOB_EXECUTED,
-    EVENT_JOB_MISSED,
-)
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from collections import defaultdict
 from server.get_odds import get_todays_odds
-from server.prep_tweet import prepare
+from server.prep_tweet import index_odds, prepare_all
+from server.outbox import outbox, outbox_worker
 from dotenv import load_dotenv  # type: ignore
 from data import LeagueStats
-import pandas as pd  # type: ignore
-import subprocess
+from ledger import ledger
 import threading
 import statsapi  # type: ignore
 import pytz  # type: ignore
-import time
 import os
 
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore
+
 # use model defined in .env or by default 'mlb4year'
 selected_model = "mlb4year"
 cwd = os.path.dirname(os.path.abspath(__file__))
@@ -27,167 +24,172 @@ load_dotenv(env_file_path)
 ret = os.getenv("SELECTED_MODEL")
 selected_model = ret if ret is not None else selected_model
 
-global_correct: int = 0
-global_wrong: int = 0
-global_biggest_upset: Optional[List] = None
-global_upset_diff: int = 0
-global_results: Optional[Tuple[str, str]] = None
-
 mlb = LeagueStats()
 
 lock = threading.Lock()
 
 eastern = pytz.timezone("America/New_York")
 
-# define daily_scheduler as global var
-daily_scheduler = None
-
-
-def get_data_path() -> str:
+# largest difference between an odds event's commence time and its game's start
+ODDS_TIME_TOLERANCE = timedelta(minutes=30)
+
+# columns of a prediction filled in once its game is complete
+RESULT_COLUMNS = [
+    "prediction_accuracy",
+    "home_score",
+    "away_score",
+    "winning_pitcher",
+    "losing_pitcher",
+    "datetime",
+    "summary",
+]
+
+def get_results(unchecked: "pd.DataFrame") -> "pd.DataFrame":
     """
-    function that will fetch the current data sheet path from .env file
+    function to get the results of the games of unchecked predictions
+        -> one schedule request per date (instead of one per game)
+        -> games not Final on their date's schedule (e.g. postponed or suspended,
+           still listed there) or not on it are requested by id, so the entry
+           followed is the game's last (e.g. its makeup date)
 
-    Returns: 
-        str: path to the data sheet from the same directory as the .env file
+    Args:
+        unchecked: data frame of predictions (needs 'game_id' and 'date')
+
+    Returns:
+        results: data frame with one row per game that is over (Final)
+            -> game_id, the game's RESULT_COLUMNS (but accuracy) and winning_team
     """
-    cwd = os.path.dirname(os.path.abspath(__file__))
-    env_file_path = os.path.join(cwd, ".env")
-    load_dotenv(env_file_path)
-    data_sheet = os.getenv("DATA_SHEET_PATH")
-    return data_sheet if data_sheet is not None else "data/predictions.xlsx"
-
-
-def print_next_job(event) -> None:
-    """function to print details about next scheduled job"""
-    time.sleep(1)
-    ret = daily_scheduler.get_jobs()
-    if daily_scheduler.running and len(ret) == 0:
-        time.sleep(5)
-        daily_scheduler.shutdown(wait=False)
-        return
-    next_job = ret[0] if (ret != []) else None
-    if next_job is not None:
-        print(
-            f"{datetime.now(eastern).strftime('%D - %I:%M:%S %p')}... "
-            f"Next Scheduled Job"
-        )
-        print(f"Job Name: {next_job.name}")
-        run_time = next_job.next_run_time
-        et_time = run_time.astimezone(eastern)
-        formatted_time = et_time.strftime("%I:%M %p")
-        print(f"Next Execution Time: {formatted_time} ET")
-        time.sleep(1)
-    return
+    # pandas is imported when needed so importing predict (e.g. from main.py)
+    # stays light
+    import pandas as pd  # type: ignore
+
+    wanted = set(int(game_id) for game_id in unchecked["game_id"])
+    games: Dict[int, Dict] = {}
+    for day in unchecked["date"].dropna().unique():
+        day_str = pd.Timestamp(day).strftime("%m/%d/%Y")
+        for game in mlb.get_schedule(day_str):
+            if int(game["game_id"]) in wanted:
+                games[int(game["game_id"])] = game
+    not_final = [
+        game_id for game_id in wanted if games.get(game_id, {}).get("status") != "Final"
+    ]
+    for game_id in not_final:
+        schedule = statsapi.schedule(game_id=game_id)
+        if schedule:
+            games[game_id] = schedule[-1]
+    columns = ["game_id"] + RESULT_COLUMNS[1:] + ["winning_team"]
+    rows = [
+        {
+            "game_id": game_id,
+            "home_score": game.get("home_score"),
+            "away_score": game.get("away_score"),
+            "winning_pitcher": game.get("winning_pitcher"),
+            "losing_pitcher": game.get("losing_pitcher"),
+            "datetime": game.get("game_datetime"),
+            "summary": game.get("summary"),
+            "winning_team": game.get("winning_team"),
+        }
+        for game_id, game in games.items()
+        if game.get("status") == "Final"
+    ]
+    return pd.DataFrame(rows, columns=columns)
 
 
-def update_row(row: pd.Series) -> pd.Series:
+def check_predictions(unchecked: "pd.DataFrame") -> "pd.DataFrame":
     """
-    function to update the row data of completed games
+    function to check unchecked predictions against the results of their games
 
     Args:
-        row: Row data as a pandas Series object.
+        unchecked: data frame of predictions without a prediction_accuracy
 
     Returns:
-        updated_row: The updated row with prediction accuracy and other information.
+        checked: data frame of the predictions whose games are over, with
+            prediction_accuracy (1.0 correct, 0.0 wrong, None if no winner),
+            the game's results, and 'winning_team'
     """
-    global global_correct, global_wrong, global_biggest_upset, global_upset_diff
-    predicted_winner = row["predicted_winner"]
-    id = row["game_id"]
-    game = statsapi.schedule(game_id=id)[-1]
-    if game["status"] != "Final":
-        return row
-    actual_winner = game.get("winning_team")
-    prediction_accuracy = (
-        1.0
-        if (actual_winner == predicted_winner)
-        else (0.0 if actual_winner is not None else None)
+    results = get_results(unchecked)
+    checked = unchecked.drop(columns=RESULT_COLUMNS[1:]).merge(
+        results, on="game_id", how="inner"
     )
-    losing_team = row["home"] if actual_winner == row["away"] else row["away"]
-    if actual_winner == row["home"]:
-        winner_odds, loser_odds = row["home_odds"], row["away_odds"]
-    else:  # actual_winner == row["away"]:
-        winner_odds, loser_odds = row["away_odds"], row["home_odds"]
-    if prediction_accuracy == 1.0:
-        global_correct += 1
-        odds_diff = int((abs(winner_odds) - 100) + (abs(loser_odds) - 100))
-        if odds_diff > global_upset_diff and winner_odds > 100:
-            global_upset_diff = odds_diff
-            global_biggest_upset = [actual_winner, winner_odds, losing_team, loser_odds]
-        print(
-            f"Correct! Your prediction - {predicted_winner} - "
-            f"defeated the {losing_team}."
-        )
-    else:
-        global_wrong += 1
-        print(
-            f"Wrong! Your prediction - {predicted_winner} - "
-            f"lost to the {actual_winner}."
-        )
-    updated_row = row.copy()
-    # update any row information needed given that the game is now complete
-    updated_row["prediction_accuracy"] = prediction_accuracy
-    updated_row["home_score"] = game["home_score"]
-    updated_row["away_score"] = game["away_score"]
-    updated_row["winning_pitcher"] = game["winning_pitcher"]
-    updated_row["losing_pitcher"] = game["losing_pitcher"]
-    updated_row["datetime"] = game.get("datetime")
-    updated_row["game_id"] = game["game_id"]
-    updated_row["summary"] = game["summary"]
-    return updated_row
-
-
-def load_unchecked_predictions_from_excel(
-    file_name: str,
-) -> Optional[pd.DataFrame]:
+    correct = checked["winning_team"] == checked["predicted_winner"]
+    checked["prediction_accuracy"] = correct.astype(float).where(
+        checked["winning_team"].notnull()
+    )
+    return checked
+
+
+def biggest_upset(checked: "pd.DataFrame") -> Optional[List]:
     """
-    function to load unchecked predictions from the excel sheet back into pd dataframe
-        -> i.e. predictions that don't yet have an input for prediction_accuracy
+    function to find the correct prediction of the biggest upset (by the odds)
 
     Args:
-        file_name: string file name to retrieve past predictions from (.xlsx)
+        checked: data frame of checked predictions (from check_predictions)
+
+    Returns:
+        upset: [winner, winner odds, loser, loser odds] or None if no upsets
+    """
+    import pandas as pd  # type: ignore
+
+    won = checked[checked["prediction_accuracy"] == 1.0]
+    home_won = won["winning_team"] == won["home"]
+    home_odds = pd.to_numeric(won["home_odds"], errors="coerce")
+    away_odds = pd.to_numeric(won["away_odds"], errors="coerce")
+    winner_odds = home_odds.where(home_won, away_odds)
+    loser_odds = away_odds.where(home_won, home_odds)
+    odds_diff = (winner_odds.abs() - 100) + (loser_odds.abs() - 100)
+    upsets = odds_diff[(winner_odds > 100) & (odds_diff > 0)]
+    if upsets.empty:
+        return None
+    # first of the largest (same as checking predictions one by one)
+    i = upsets.idxmax()
+    loser = won.at[i, "away"] if home_won[i] else won.at[i, "home"]
+    return [won.at[i, "winning_team"], int(winner_odds[i]), loser, int(loser_odds[i])]
+
+
+def load_unchecked_predictions() -> Optional["pd.DataFrame"]:
+    """
+    function to load unchecked predictions from the ledger and check their results
+        -> i.e. predictions that don't yet have an input for prediction_accuracy
+        -> only the rows of games that are now complete are updated
+        -> tweets the number correct (and the biggest upset) if any were checked
 
     Returns:
-        df: data frame with past predictions
+        checked: data frame with the predictions that were checked
     """
-    global global_results, global_correct, global_wrong
-    global global_biggest_upset, global_upset_diff
-    # reset before checking results
-    global_correct = 0
-    global_wrong = 0
-    global_biggest_upset = None
-    global_upset_diff = 0
-    global_results = None
     try:
-        df = pd.read_excel(file_name)
-        df_missing_accuracy = df[df["prediction_accuracy"].isnull()]
-        df_missing_accuracy = df_missing_accuracy.apply(update_row, axis=1)
-        if (global_correct + global_wrong) > 0:
-            print("\n")
-            percentage = (
-                str(
-                    int(
-                        100
-                        * round((global_correct / (global_correct + global_wrong)), 2)
-                    )
+        unchecked = ledger.unchecked()
+        if unchecked.empty:
+            return unchecked
+        checked = check_predictions(unchecked)
+        for _, row in checked.iterrows():
+            if row["prediction_accuracy"] == 1.0:
+                losing_team = (
+                    row["home"] if row["winning_team"] == row["away"] else row["away"]
                 )
-                + "%"
-            )
-            correct_wrong = (
-                f"{str(global_correct)}/{str(global_wrong + global_correct)}"
-            )
-            global_results = correct_wrong, percentage
-            if global_biggest_upset is not None:
-                is_upset = True
-                (
-                    upset_winner,
-                    upset_w_odds,
-                    upset_loser,
-                    upset_l_odds,
-                ) = global_biggest_upset
+                print(
+                    f"Correct! Your prediction - {row['predicted_winner']} - "
+                    f"defeated the {losing_team}."
+                )
+            else:
+                print(
+                    f"Wrong! Your prediction - {row['predicted_winner']} - "
+                    f"lost to the {row['winning_team']}."
+                )
+            # missing values never overwrite what the ledger has
+            ledger.update(row["game_id"], row[RESULT_COLUMNS].dropna().to_dict())
+        num_correct = int((checked["prediction_accuracy"] == 1.0).sum())
+        num_checked = len(checked)
+        if num_checked > 0:
+            print("\n")
+            percentage = str(int(100 * round((num_correct / num_checked), 2))) + "%"
+            correct_wrong = f"{str(num_correct)}/{str(num_checked)}"
+            upset = biggest_upset(checked)
+            if upset is not None:
+                upset_winner, upset_w_odds, upset_loser, upset_l_odds = upset
                 res = gen_result_tweet(
                     correct_wrong,
                     percentage,
-                    is_upset,
+                    True,
                     upset_winner,
                     upset_loser,
                     upset_w_odds,
@@ -200,30 +202,31 @@ def load_unchecked_predictions_from_excel(
                 )
             if res:
                 send_tweet(res)
-        df.update(df_missing_accuracy)
-        df.to_excel(file_name, index=False)
-        return df
-    except FileNotFoundError:
+        return checked
+    except Exception as e:
+        print(f"Error checking past predictions. {e}")
         return None
 
 
-def safely_prepare(row: pd.Series) -> str:
+def safely_prepare(rows: "pd.DataFrame", all_games: List[Dict], odds_time) -> List[str]:
     """
     function to orchastrate mutual exclusion
-    -> protecting overrides on predictions.xlsx
+    -> protecting concurrent updates of predictions' rows in the ledger
 
     Args:
-        row: pandas series with a single game's info
+        rows: data frame of predictions to prepare
+        all_games: today's games with odds (from get_todays_odds)
+        odds_time: time the odds were retrieved
 
     Returns: 
-        tweet_line = line of tweet from the game prepared
+        tweet_lines = line of tweet from each game prepared
     """
     try:
         lock.acquire()
-        tweet_line = prepare(row)
+        tweet_lines = prepare_all(rows, index_odds(all_games), odds_time)
     finally:
         lock.release()
-    return tweet_line
+    return tweet_lines
 
 def are_within_30_minutes(dt1, dt2):
     """
@@ -236,15 +239,78 @@ def are_within_30_minutes(dt1, dt2):
     Returns: 
         bool if within 30 minutes or not
     """
+    return time_apart(dt1, dt2) <= timedelta(minutes=30)
+
+
+def time_apart(dt1, dt2) -> timedelta:
+    """
+    function to get the time between two datetime strings
+
+    Args:
+        dt1: first datetime object string
+        dt2: second datetime object string
+
+    Returns:
+        diff: absolute difference between the two times
+    """
     dt1 = datetime.fromisoformat(dt1.rstrip('Z'))
     dt2 = datetime.fromisoformat(dt2.rstrip('Z'))
-    diff = abs(dt1-dt2)
-    thirty_mins = timedelta(minutes=30)
-    return diff <= thirty_mins
+    return abs(dt1 - dt2)
+
+
+def match_odds_to_games(
+    odds_games: List[Dict], day_games: List[Dict], tolerance=ODDS_TIME_TOLERANCE
+) -> List[Tuple]:
+    """
+    function to pair each of today's odds events with its game in the schedule
+        -> the schedule is indexed by (home, away) so each event is a lookup
+        -> a doubleheader's events are paired with its games in start order
+
+    Args:
+        odds_games: today's games with odds (from get_todays_odds)
+        day_games: every game scheduled today (from LeagueStats.get_schedule)
+        tolerance: largest difference between an event's commence time and the
+            scheduled start of a (single) game
+
+    Returns:
+        scheduled: (game_id, odds game) for each matched game
+            -> (game_id, odds game, game_num) for the games of a doubleheader
+    """
+    today = datetime.now(eastern).date().strftime("%Y-%m-%d")
+    schedule: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+    for day_game in day_games:
+        if day_game.get("game_date") == today:
+            schedule[(day_game["home_name"], day_game["away_name"])].append(day_game)
+    # odds events grouped by matchup (in the order the odds list them)
+    events: Dict[Tuple[str, str], List[Dict]] = defaultdict(list)
+    for game in odds_games:
+        if game.get("date") == "Today":
+            events[(game["home_team"], game["away_team"])].append(game)
+
+    scheduled: List[Tuple] = []
+    for matchup, games in events.items():
+        teams_games = schedule.get(matchup, [])
+        if len(teams_games) == 1:
+            day_game = teams_games[0]
+            game = min(
+                games,
+                key=lambda g: time_apart(day_game["game_datetime"], g["commence_time"]),
+            )
+            if time_apart(day_game["game_datetime"], game["commence_time"]) > tolerance:
+                continue
+            scheduled.append((day_game.get("game_id"), game))
+        elif len(teams_games) > 1:
+            # later games of a doubleheader start whenever the previous one ends,
+            # so events and games are paired by order instead of by time
+            teams_games = sorted(teams_games, key=lambda g: g.get("game_num") or 0)
+            games = sorted(games, key=lambda g: g["commence_time"])
+            for day_game, game in zip(teams_games, games):
+                scheduled.append((day_game.get("game_id"), game, day_game.get("game_num")))
+    return scheduled
 
 
 def generate_daily_predictions(
-    model: str = selected_model, date = datetime.now()
+    model: str = selected_model, date: Optional[datetime] = None
 ) -> List:
     """
     function to generate predictions for one day of MLB games...
@@ -253,111 +319,74 @@ def generate_daily_predictions(
     Args:
         model: model to use
             -> must be defined in MODELS
-        date: datetime object representing day to predict on
+        date: datetime object representing day to predict on (defaults to now)
 
     Returns:
         tweet_lines: List of strings, each representing a line of the tweet 
     """
-    if date is not datetime.now():
+    if date is None:
+        # resolved on each call: a default argument would be frozen at import
+        # time, which is days old by the time a long-running main.py predicts
+        date = datetime.now()
+    else:
         # NOT IMPLEMENTED: generating predictions for future days
         pass
-    data_file = os.path.join(cwd, get_data_path())
     scheduled_ids = []
     predicted_ids = []
     model = selected_model
     tweet_lines = []
-    try:
-        df = pd.read_excel(data_file)
-        dates = pd.to_datetime(df["date"]).dt.tz_localize(pytz.utc)
-        existing_dates = dates.dt.tz_convert(eastern).dt.date.unique()
-        existing_dates_list = [str(date) for date in existing_dates]
-        check_date = str(date.date())
-        if check_date in existing_dates_list:
-            d = pd.to_datetime(df["date"]).dt.tz_localize(pytz.utc)
-            d = d.dt.tz_convert(eastern).dt.date
-            mask = (d == date.date()) & (df["tweeted?"] == False)
-            to_tweet_today = df[mask]
-            if not to_tweet_today.empty:
-                print(
-                    f"{datetime.now(eastern).strftime('%D - %I:%M:%S %p')}... "
-                    f"\nFound {str(len(to_tweet_today))} "
-                    f"games in sheet that need to be published (tweeted)\n"
-                )
-                for _, row in to_tweet_today.iterrows():
-                    scheduled_ids.append(row["game_id"])
-                    predicted_ids.append(row["game_id"])
-                    line = safely_prepare(row)
-                    tweet_lines.append(line)
-                    print(
-                        f"{datetime.now(eastern).strftime('%D - %I:%M:%S %p')}... \nAdded game "
-                        f"({row['away']} @ {row['home']}) to tweet (from sheet)"
-                    )
-    except FileNotFoundError:
-        df = pd.DataFrame()
-
+    # odds retrieved once for the whole run
     all_games, odds_time = get_todays_odds()
+    # games already predicted today (those not yet tweeted are added to the tweet)
+    predicted_today = ledger.on_date(date.date())
+    predicted_ids.extend(predicted_today["game_id"].tolist())
+    to_tweet_today = predicted_today[predicted_today["tweeted?"].fillna(0) == 0]
+    # lines already waiting in the outbox are sent from there
+    to_tweet_today = to_tweet_today[~to_tweet_today["tweet"].isin(outbox.queued_lines())]
+    if not to_tweet_today.empty:
+        print(
+            f"{datetime.now(eastern).strftime('%D - %I:%M:%S %p')}... "
+            f"\nFound {str(len(to_tweet_today))} "
+            f"games in ledger that need to be published (tweeted)\n"
+        )
+        tweet_lines.extend(safely_prepare(to_tweet_today, all_games, odds_time))
+        for _, row in to_tweet_today.iterrows():
+            scheduled_ids.append(row["game_id"])
+            print(
+                f"{datetime.now(eastern).strftime('%D - %I:%M:%S %p')}... \nAdded game "
+                f"({row['away']} @ {row['home']}) to tweet (from ledger)"
+            )
+
     game_predictions: List[Dict] = []
     print(
         f"{datetime.now(eastern).strftime('%D - %I:%M:%S %p')}..."
         f"\nMaking predictions using {selected_model} model\n"
     )
 
-    scheduled_doubleheaders = []
-    # loop to get game_ids of all games to make predictions on (saved to scheduled_ids)
-    for game in all_games:
-        if game.get("date") != "Today":
-            continue
-        today = datetime.now().strftime("%m/%d/%Y")
-        teams_games = mlb.get_days_games(game.get("home_team"), today)
-        if not teams_games:
-            continue
-        if len(teams_games) == 2:
-            first, second = teams_games[0], teams_games[1]
-            if first.get("game_id") and second.get("game_id") in scheduled_doubleheaders:
-                continue
-            for game in all_games:
-                if game['home_team'] != first['home_name']:
-                    continue
-                doubleheader_game = first.get("game_num")
-                scheduled_ids.append((first.get("game_id"), game, doubleheader_game))
-                scheduled_doubleheaders.append(first.get("game_id"))
-                first_ct = game.get("commence_time")
-                break
-            for game in all_games:
-                if game['home_team'] != second['home_name']:
-                    continue
-                if game.get("commence_time") == first_ct:
-                    continue
-                doubleheader_game = second.get("game_num")
-                scheduled_ids.append((second.get("game_id"), game, doubleheader_game))
-                scheduled_doubleheaders.append(second.get("game_id"))
-                break
-            continue
-        elif len(teams_games) == 1:
-            day_game = teams_games[0]
-            # if day_game['game_datetime'] != game['commence_time']:
-            if not are_within_30_minutes(day_game['game_datetime'], game['commence_time']):
-                continue
-            if (day_game.get("game_id") not in scheduled_ids) and (
-                day_game.get("game_date")
-                == datetime.now(eastern).date().strftime("%Y-%m-%d")
-            ):
-                scheduled_ids.append((day_game.get("game_id"), game))
-
-    # loop to make predictions and schedule all the games in scheduled_ids
-    for gameObj in scheduled_ids:
-        try:
-            gamePk = gameObj[0]
-            if gamePk in predicted_ids:
-                continue
-            game = gameObj[1]
-            ret = mlb.predict_game(gamePk)
-            if ret is None or ret[0] is None:
-                continue
-            winner, prediction, info = ret[0], ret[1], ret[2]
-        except Exception as e:
-            print(f"Error predicting next game: \n{e}\n")
+    # one schedule request for the whole day, matched against the odds events
+    today = datetime.now().strftime("%m/%d/%Y")
+    scheduled_ids.extend(match_odds_to_games(all_games, mlb.get_schedule(today)))
+
+    # games in scheduled_ids not yet predicted (ids from the sheet are already done)
+    to_predict = [
+        gameObj
+        for gameObj in scheduled_ids
+        if isinstance(gameObj, tuple) and gameObj[0] not in predicted_ids
+    ]
+    # make predictions on the whole slate at once
+    try:
+        results = mlb.predict_games([gameObj[0] for gameObj in to_predict])
+    except Exception as e:
+        print(f"Error predicting today's games: \n{e}\n")
+        results = []
+
+    # loop to schedule all the games that were predicted
+    for gameObj, ret in zip(to_predict, results):
+        game = gameObj[1]
+        if ret is None or ret[0] is None:
+            print(f"Error predicting next game: \n{ret[1] if ret else None}\n")
             continue
+        winner, prediction, info = ret[0], ret[1], ret[2]
         if len(gameObj) == 3:
             doubleheader_game = gameObj[2]
         if not winner:
@@ -394,127 +423,38 @@ def generate_daily_predictions(
         tweet_lines.append(tweet)
         game_predictions.append(info)
 
-    df_new = pd.DataFrame(game_predictions)
-    column_order = [
-        "prediction_accuracy",
-        "date",
-        "time",
-        "home",
-        "home_probable",
-        "away",
-        "away_probable",
-        "predicted_winner",
-        "model",
-        "favorite",
-        "home_odds",
-        "home_odds_bookmaker",
-        "away_odds",
-        "away_odds_bookmaker",
-        "home_score",
-        "away_score",
-        "winning_pitcher",
-        "losing_pitcher",
-        "prediction_value",
-        "venue",
-        "series_status",
-        "national_broadcasts",
-        "odds_retrieval_time",
-        "prediction_generation_time",
-        "datetime",
-        "game_id",
-        "summary",
-        "tweet",
-        "time_to_tweet",
-        "tweeted?",
-    ]
-    try:
-        if len(df_new) > 0:
-            df_new = df_new[column_order]
-            df = pd.concat([df, df_new], ignore_index=True)
-            df.to_excel(data_file, index=False)
-        else:
-            print(
-                f"{datetime.now(eastern).strftime('%D - %I:%M:%S %p')}... \n"
-                f"No new predictions made for games\n"
-            )
-    except Exception as _:
+    if game_predictions:
+        ledger.add(game_predictions)
+    else:
         print(
             f"{datetime.now(eastern).strftime('%D - %I:%M:%S %p')}... \n"
-            f"No new games to added to data sheet\n"
+            f"No new predictions made for games\n"
         )
     return tweet_lines
 
 
-def mark_as_tweeted(tweet: str) -> None:
-    """
-    Function to mark a tweet as tweeted in the data sheet
-
-    Args: 
-        tweet: tweet that has been sent and should be marked as sent
-    """
-    # read predictions in dataframe
-    df = pd.read_excel(get_data_path())
-    # split tweet to get individual tweet lines
-    lines = tweet.split('\n')
-    # find row with current tweet, and marked 'tweeted?' as True
-    for line in lines:
-        # preprocess tweet to get rid of formatting
-        line = line.replace("•", "")
-        line = line.strip()
-        try:
-            df.loc[df['tweet'] == line, 'tweeted?'] = True 
-        except:
-            print(
-                f"Failed to mark tweet... \n"
-                f"'{line}' as tweeted."
-            )
-            continue
-    # write back to excel
-    df.to_excel(get_data_path(), index=False)
-
-
-def send_tweet(tweet: str) -> bool:
+def send_tweet(tweet: str, purpose: str = "results") -> bool:
     """
     Function to send a tweet 
+        -> queued in the outbox and sent by its worker (retried if it fails)
 
     Args: 
         tweet: tweet to send
+        purpose: what the tweet is for (part of its key in the outbox)
 
     Returns: 
-        bool: True or False to represent success or failure
+        bool: True once the tweet is queued
 
     """
-    try:
-        tweet_script = os.path.join(cwd, "server/tweet.py")
-        process = subprocess.Popen(
-            ["python3", tweet_script, tweet],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        process.wait()
-        stdout, stderr = process.communicate()
-        print(stdout.strip())
-        print(stderr.strip())
-        return_code = process.poll()
-        if return_code != 0:
-            print(f"Error calling tweet.py: return code={return_code}")
-            return False 
-        mark_as_tweeted(tweet)
-        return True
-    except subprocess.CalledProcessError as e:
-        print(
-            f"{datetime.now(eastern).strftime('%D - %I:%M:%S %p')}... "
-            f"\nError tweeting results{e}\n"
-        )
-        return False
+    outbox.enqueue([tweet], purpose)
+    return True
 
 
 def schedule_tweets(tweet_lines: List[str]) -> None: 
     """
     Function to schedule the prediction tweet(s) for the day 
         -> Will make call to tweet_generator.py for body of tweet(s)
-        -> Will schedule add tweet script subprocess for each tweet
+        -> Will queue the tweets in the outbox to be sent as a thread at 9:45
 
     Args: 
         tweet_lines: list of prediction strings for each individual game
@@ -522,73 +462,56 @@ def schedule_tweets(tweet_lines: List[str]) -> None:
     Returns: 
         None
     """
-    global daily_scheduler
     if not tweet_lines:
         return
     tweets = create_tweets(tweet_lines)
     now = datetime.now(eastern)
     start_time = now.replace(hour=9, minute=45, second=0, microsecond=0)
     end_time = now.replace(hour=23, minute=59, second=59, microsecond=0)
-    delay = 0
-    # add each tweet to the scheduler
-    for tweet in tweets[::-1]:
-        now = datetime.now(eastern)
-        # check if missed normal tweet time (before 9:45 AM)
-        if start_time <= now <= end_time:
-            # If missed normal time (after 9:45) schedule tweet in 10 mins
-            tweet_time = now + timedelta(minutes=1, seconds=delay)
-        else:
-            # schedule tweet
-            tweet_time = datetime.now().replace(hour=9, minute=45, second=delay, microsecond=0)
-        print("Scheduling Tweet...\n")
-        daily_scheduler.add_job(
-            send_tweet, args=[tweet], trigger="date", run_date=tweet_time
-        )
+    # check if missed normal tweet time (before 9:45 AM)
+    if start_time <= now <= end_time:
+        # If missed normal time (after 9:45) send tweets in 1 min
+        tweet_time = now + timedelta(minutes=1)
+    else:
+        # schedule tweets
+        tweet_time = datetime.now().replace(hour=9, minute=45, second=0, microsecond=0)
+    # the tweets are sent together as a thread (1/n first, the rest as replies)
+    print("Scheduling Tweets...\n")
+    outbox.enqueue(tweets, "predictions", not_before=tweet_time)
+    for tweet in tweets:
         print(
             f"{datetime.now(eastern).strftime('%D - %I:%M:%S %p')}..."
             f"\n{tweet}\n"
             f"...scheduled to be sent at {tweet_time.strftime('%D - %I:%M:%S %p')}\n"
         )
-        delay += 5
     return
 
 
-def check_and_predict():
-    global daily_scheduler
-    daily_scheduler = None
-    data_file = os.path.join(cwd, get_data_path())
-    try:
-        load_unchecked_predictions_from_excel(data_file)
-    except Exception as e:
-        print(f"Error checking past predictions in {data_file}. {e}")
-
-    # create daily scheduler
-    daily_scheduler = BlockingScheduler(
-        job_defaults={"coalesce": False},
-        timezone=eastern,
-    )
-    daily_scheduler.add_listener(print_next_job, EVENT_SCHEDULER_STARTED)
-    daily_scheduler.add_listener(print_next_job, EVENT_JOB_EXECUTED)
-    daily_scheduler.add_listener(print_next_job, EVENT_JOB_MISSED)
-
+def predict_and_queue() -> None:
+    """function to make today's predictions and queue their tweets in the outbox"""
     tweet_lines = generate_daily_predictions()
-    '''try:
-        schedule_tweets(tweet_lines)
-    except Exception as e:
-        print(f"Error sending prediction tweet(s). {e}")'''
     schedule_tweets(tweet_lines)
 
-    # start call is blocking, so scheduler shutdown in listener when last event finished
-    daily_scheduler.start()
+
+def check_and_predict():
+    """
+    function to check yesterday's predictions and queue today's prediction tweets
+        -> returns once the tweets are queued (the outbox worker sends them)
+        -> main.py runs these steps as separate jobs instead
+    """
+    outbox_worker.start()
+    load_unchecked_predictions()
+    predict_and_queue()
     print(
         f"{datetime.now(eastern).strftime('%D - %I:%M:%S %p')}... "
-        f"\nAll prediction tweets sent. "
+        f"\nAll prediction tweets queued. "
         f"Exiting predict.py check_and_predict\n"
     )
-    time.sleep(10)
-    daily_scheduler = None
     return
 
 
 if __name__ == "__main__":
     check_and_predict()
+    # stay up until every queued tweet is sent
+    outbox_worker.stop()
+    outbox_worker.run_until_empty()
@@ -0,0 +1,97 @@
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import threading
+import pickle
+import os
+
+if TYPE_CHECKING:
+    import lightgbm as lgb  # type: ignore
+
+cwd = os.path.dirname(os.path.abspath(__file__))
+
+# directory holding <model>.txt boosters and scalers/<model>_scaler.pkl
+MODELS_DIR = os.path.join(cwd, "models")
+
+
+class ModelBundle:
+    """
+    everything needed to make predictions with one model
+        -> the booster, the scaler fit on its training data and its feature order
+    """
+
+    def __init__(
+        self,
+        name: str,
+        order: str,
+        columns: Optional[List[str]],
+        booster: "lgb.Booster",
+        scaler,
+    ):
+        self.name = name
+        self.order = order
+        self.columns = columns
+        self.booster = booster
+        self.scaler = scaler
+
+    def __repr__(self):
+        return f"ModelBundle({self.name}, {self.order})"
+
+
+class ModelRegistry:
+    """
+    model bundles loaded once per process
+        -> a bundle is reloaded when its model or scaler file changes on disk
+           so models can be swapped without restarting main.py
+    """
+
+    def __init__(self, models_dir: str = MODELS_DIR):
+        self.models_dir = models_dir
+        self.bundles: Dict[Tuple[str, str], Tuple[Tuple[float, float], ModelBundle]] = {}
+        self.lock = threading.Lock()
+
+    def model_path(self, name: str) -> str:
+        """method to get the path of a model's booster (.txt)"""
+        return os.path.join(self.models_dir, f"{name}.txt")
+
+    def scaler_path(self, name: str) -> str:
+        """method to get the path of a model's scaler (.pkl)"""
+        return os.path.join(self.models_dir, "scalers", f"{name}_scaler.pkl")
+
+    def get(
+        self, name: str, order: str, columns: Optional[List[str]] = None
+    ) -> ModelBundle:
+        """
+        method to get a model's bundle (loading it if new or changed on disk)
+
+        Args:
+            name: name of the model (e.g. "mlb4year")
+            order: name of the feature order the model uses (e.g. "order2")
+            columns: features in that order (None to keep the standard order)
+
+        Returns:
+            bundle: the model's booster, scaler, and feature order
+
+        Raises:
+            FileNotFoundError: if the model or its scaler isn't in the models folder
+        """
+        model_path, scaler_path = self.model_path(name), self.scaler_path(name)
+        mtimes = (os.path.getmtime(model_path), os.path.getmtime(scaler_path))
+        key = (name, order)
+        with self.lock:
+            cached = self.bundles.get(key)
+            if cached and cached[0] == mtimes:
+                return cached[1]
+            # lightgbm (and the sklearn it pulls in) is imported with the first model
+            import lightgbm as lgb  # type: ignore
+
+            with open(scaler_path, "rb") as file:
+                scaler = pickle.load(file)
+            booster = lgb.Booster(model_file=model_path)
+            bundle = ModelBundle(name, order, columns, booster, scaler)
+            if cached:
+                print(f"Reloaded model {name} after a change on disk.")
+            self.bundles[key] = (mtimes, bundle)
+            return bundle
+
+
+# shared registry used by data.py
+registry = ModelRegistry()
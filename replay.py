@@ -0,0 +1,165 @@
+from typing import Any, Callable, Dict, Optional
+from datetime import datetime
+from cache import api, RateLimiter, MAX_CONCURRENT_REQUESTS
+from server.odds_store import odds_store
+import statsapi  # type: ignore
+import contextlib
+import threading
+import hashlib
+import pickle
+import json
+import os
+
+cwd = os.path.dirname(os.path.abspath(__file__))
+
+# directory holding recorded fixtures (one sub-directory per fixture)
+FIXTURES_DIR = os.path.join(cwd, "fixtures")
+
+# statsapi functions the pipeline calls (directly or through cache.py)
+STATSAPI_FUNCTIONS = [
+    "schedule",
+    "boxscore_data",
+    "standings_data",
+    "player_stat_data",
+    "team_leader_data",
+    "lookup_player",
+    "lookup_team",
+    "last_game",
+    "next_game",
+    "get",
+]
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+class FixtureMissing(LookupError):
+    """raised when replaying a call that was never recorded"""
+
+
+class ReplayTransport:
+    """
+    records every statsapi call and odds request to a fixture directory or serves
+    them back from it (so the pipeline can run offline and deterministically)
+        -> responses are pickled to <fixture_dir>/<function>/<key>.pkl
+        -> key is a hash of the call's arguments (like cache.py)
+        -> manifest.json lists every call and the time the fixture was recorded
+        -> while installed the disk cache is bypassed, and replayed calls aren't
+           rate limited
+    """
+
+    def __init__(self, fixture_dir: str, mode: str = REPLAY):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"mode must be '{RECORD}' or '{REPLAY}', not '{mode}'")
+        self.fixture_dir = fixture_dir
+        self.mode = mode
+        self.lock = threading.Lock()
+        self.manifest = self.read_manifest()
+
+    def manifest_path(self) -> str:
+        """method to get the path of the fixture's manifest"""
+        return os.path.join(self.fixture_dir, "manifest.json")
+
+    def read_manifest(self) -> Dict:
+        """method to read the fixture's manifest (empty if there isn't one yet)"""
+        try:
+            with open(self.manifest_path(), "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"recorded_at": None, "calls": {}}
+
+    def write_manifest(self) -> None:
+        """method to write the fixture's manifest"""
+        os.makedirs(self.fixture_dir, exist_ok=True)
+        with open(self.manifest_path(), "w") as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+
+    @property
+    def recorded_at(self) -> Optional[datetime]:
+        """time the fixture was recorded (None if nothing has been recorded)"""
+        recorded_at = self.manifest.get("recorded_at")
+        return datetime.fromisoformat(recorded_at) if recorded_at else None
+
+    def _path(self, name: str, args: tuple, kwargs: Dict) -> str:
+        """
+        method to get the file path that a call's response is stored at
+
+        Args:
+            name: name of the function called
+            args: positional arguments of the call
+            kwargs: keyword arguments of the call
+
+        Returns:
+            path: file path of the recorded response
+        """
+        raw = json.dumps([args, kwargs], sort_keys=True, default=str)
+        key = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+        return os.path.join(self.fixture_dir, name, f"{key}.pkl")
+
+    def call(self, name: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        method to record a call's response or serve its recorded response
+
+        Args:
+            name: name of the function called
+            func: function to call when recording
+            args: positional arguments of the call
+            kwargs: keyword arguments of the call
+
+        Returns:
+            response: response of func(*args, **kwargs)
+
+        Raises:
+            FixtureMissing: if replaying a call that wasn't recorded
+        """
+        path = self._path(name, args, kwargs)
+        if self.mode == REPLAY:
+            try:
+                with open(path, "rb") as f:
+                    return pickle.load(f)
+            except FileNotFoundError:
+                raise FixtureMissing(
+                    f"{name}(*{args!r}, **{kwargs!r}) is not in {self.fixture_dir}"
+                ) from None
+        response = func(*args, **kwargs)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(response, f)
+        with self.lock:
+            relative = os.path.relpath(path, self.fixture_dir)
+            self.manifest["calls"][relative] = json.loads(
+                json.dumps({"function": name, "args": args, "kwargs": kwargs}, default=str)
+            )
+        return response
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """method to wrap a function so its calls go through the transport"""
+
+        def wrapped(*args, **kwargs):
+            return self.call(name, func, *args, **kwargs)
+
+        wrapped.__name__ = getattr(func, "__name__", name)
+        return wrapped
+
+    @contextlib.contextmanager
+    def installed(self):
+        """context manager that routes statsapi and odds requests through the transport"""
+        originals = {name: getattr(statsapi, name) for name in STATSAPI_FUNCTIONS}
+        enabled, limiter = api.enabled, api.limiter
+        for name, func in originals.items():
+            setattr(statsapi, name, self.wrap(f"statsapi.{name}", func))
+        odds_store.request = self.wrap("odds_store.request", odds_store.request)
+        api.enabled = False
+        if self.mode == REPLAY:
+            api.limiter = RateLimiter(MAX_CONCURRENT_REQUESTS, float("inf"))
+        else:
+            self.manifest["recorded_at"] = datetime.now().isoformat()
+        try:
+            yield self
+        finally:
+            for name, func in originals.items():
+                setattr(statsapi, name, func)
+            del odds_store.request
+            api.enabled, api.limiter = enabled, limiter
+            if self.mode == RECORD:
+                self.write_manifest()
@@ -1,74 +1,45 @@
 from datetime import datetime, timedelta
 from typing import Dict, Tuple, Optional
-from dotenv import load_dotenv  # type: ignore
-import requests  # type: ignore
+from server.odds_store import odds_store, REQUEST_COOLDOWN
 import calendar
 import pytz  # type: ignore
-import json
 import os
 
-# minimum time between requests
-REQUEST_COOLDOWN = 900 # 0.25 hour
-
 parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
 
 def make_request() -> Optional[Tuple[Optional[Dict], Optional[datetime]]]:
-    # load environment variables from .env
-    env_file_path = os.path.join(parent_dir, ".env")
-    load_dotenv(env_file_path)
-    # access the API key
-    apikey = os.getenv("ODDS_API_KEY")
-    # API endpoint
-    url = "https://api.the-odds-api.com/v4/sports/baseball_mlb/odds"
-    # query parameters
-    params = {
-        "apiKey": apikey,
-        "regions": "us",
-        "markets": "h2h",
-        "oddsFormat": "american",
-    }
-    data: Dict = None
-    request_time: datetime = None
-    data_file = os.path.join(parent_dir, "data/todays_odds.json")
-    if os.path.exists(data_file):
-        modified_time = os.path.getmtime(data_file)
-        current_time = datetime.now().timestamp()
-        time_difference = current_time - modified_time
-        # read file data without making new request
-        if time_difference < REQUEST_COOLDOWN:
-            with open(data_file, "r") as file:
-                data = json.load(file)
-            request_time = datetime.fromtimestamp(modified_time)
-        else:
-            # makes API request
-            response = requests.get(url, params)
-            # check if response is successful
-            if response.status_code == 200:
-                # parse JSON response
-                data = response.json()
-                # save data to file
-                with open(data_file, "w") as file:
-                    json.dump(data, file)
-                request_time = datetime.now()
-            else:
-                print("Error occureed. Status code: ", response.status_code)
-    else:
-        # makes API request
-        response = requests.get(url, params)
-        # check if response is successful
-        if response.status_code == 200:
-            # parse JSON response
-            data = response.json()
-            # save data to file
-            with open(data_file, "w") as file:
-                json.dump(data, file)
-            request_time = datetime.now()
-        else:
-            print("Error occureed. Status code: ", response.status_code)
-    if data is None or request_time is None:
+    """
+    function to get the latest odds snapshot
+        -> a new one is requested only if the latest is older than REQUEST_COOLDOWN
+
+    Returns:
+        data: list of events (the-odds-api format)
+        request_time: time the snapshot was retrieved
+
+        or None if no odds could be retrieved
+    """
+    return odds_store.latest(REQUEST_COOLDOWN)
+
+
+def get_odds_as_of(when: datetime):
+    """
+    function to get the odds of games as they were at a given time (no request)
+
+    Args:
+        when: time to get the odds at
+
+    Returns:
+        games: list of python dictionaries representing individual MLB games
+        time: time the odds were retrieved
+
+        or None if there are no odds from before that time
+    """
+    res = odds_store.as_of(when)
+    if not res:
         return None
-    return data, request_time
+    data, time = res
+    return process_data(data), time
 
 
 def get_favorite(game: Dict) -> Optional[str]:
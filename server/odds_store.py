@@ -0,0 +1,253 @@
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from dotenv import load_dotenv  # type: ignore
+import requests  # type: ignore
+import contextlib
+import threading
+import sqlite3
+import fcntl
+import time
+import os
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# sqlite database holding every odds snapshot retrieved
+ODDS_DB_PATH = os.path.join(parent_dir, "data/odds.db")
+
+# minimum time between requests
+REQUEST_COOLDOWN = 900  # 0.25 hour
+
+ODDS_URL = "https://api.the-odds-api.com/v4/sports/baseball_mlb/odds"
+
+
+class OddsStore:
+    """
+    append-only history of odds snapshots (one row per event, bookmaker, snapshot)
+        -> every snapshot retrieved is also listed in the snapshots table, so an
+           empty one (e.g. an off day) still counts towards the cooldown
+        -> a new snapshot is requested only when the latest is older than the cooldown
+        -> one caller at a time (threads and processes) may request a snapshot, the
+           rest wait and read what it stored
+        -> any past snapshot can be read back without an API call
+    """
+
+    def __init__(self, db_path: str = ODDS_DB_PATH):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def connect(self):
+        """context manager of a connection (committed when the block exits)"""
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS snapshots (retrieved_at REAL PRIMARY KEY)"
+                )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS odds ("
+                    "retrieved_at REAL NOT NULL, event_id TEXT NOT NULL, "
+                    "commence_time TEXT, home_team TEXT, away_team TEXT, "
+                    "bookmaker_key TEXT, bookmaker TEXT, last_update TEXT, "
+                    "home_price INTEGER, away_price INTEGER)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS odds_retrieved_at ON odds (retrieved_at)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS odds_event ON odds (event_id, retrieved_at)"
+                )
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @contextlib.contextmanager
+    def single_flight(self):
+        """context manager held while checking for (and requesting) a snapshot"""
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        with self.lock:
+            with open(f"{self.db_path}.lock", "w") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def request(self) -> Optional[List[Dict]]:
+        """
+        method to request the current odds from the-odds-api
+
+        Returns:
+            data: list of events (the-odds-api format) or None if the request failed
+        """
+        # load environment variables from .env
+        env_file_path = os.path.join(parent_dir, ".env")
+        load_dotenv(env_file_path)
+        params = {
+            "apiKey": os.getenv("ODDS_API_KEY"),
+            "regions": "us",
+            "markets": "h2h",
+            "oddsFormat": "american",
+        }
+        response = requests.get(ODDS_URL, params)
+        if response.status_code != 200:
+            print("Error occureed. Status code: ", response.status_code)
+            return None
+        return response.json()
+
+    def append(self, data: List[Dict], retrieved_at: float) -> None:
+        """
+        method to add a snapshot to the store
+
+        Args:
+            data: list of events (the-odds-api format)
+            retrieved_at: time the snapshot was requested (unix timestamp)
+        """
+        rows = []
+        for event in data:
+            home, away = event["home_team"], event["away_team"]
+            for bookmaker in event.get("bookmakers", []):
+                for market in bookmaker.get("markets", []):
+                    if market.get("key") != "h2h":
+                        continue
+                    prices = {o["name"]: o["price"] for o in market["outcomes"]}
+                    rows.append(
+                        (
+                            retrieved_at,
+                            event["id"],
+                            event["commence_time"],
+                            home,
+                            away,
+                            bookmaker.get("key"),
+                            bookmaker.get("title"),
+                            bookmaker.get("last_update"),
+                            prices.get(home),
+                            prices.get(away),
+                        )
+                    )
+            if not event.get("bookmakers"):
+                # events without odds are kept so the snapshot still lists them
+                rows.append(
+                    (retrieved_at, event["id"], event["commence_time"], home, away)
+                    + (None,) * 5
+                )
+        with self.connect() as connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO snapshots VALUES (?)", (retrieved_at,)
+            )
+            connection.executemany(
+                "INSERT INTO odds VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def snapshot_time(self, as_of: Optional[float] = None) -> Optional[float]:
+        """
+        method to get the time of the latest snapshot (at or before as_of)
+
+        Args:
+            as_of: unix timestamp (defaults to now)
+
+        Returns:
+            retrieved_at: time of the snapshot or None if there isn't one
+        """
+        with self.connect() as connection:
+            row = connection.execute(
+                "SELECT MAX(retrieved_at) FROM snapshots WHERE retrieved_at <= ?",
+                (as_of if as_of is not None else time.time(),),
+            ).fetchone()
+        return row[0] if row else None
+
+    def read(self, retrieved_at: float) -> List[Dict]:
+        """
+        method to read a stored snapshot back in the-odds-api format
+
+        Args:
+            retrieved_at: time of the snapshot
+
+        Returns:
+            data: list of events (the-odds-api format)
+        """
+        with self.connect() as connection:
+            rows = connection.execute(
+                "SELECT event_id, commence_time, home_team, away_team, bookmaker_key, "
+                "bookmaker, last_update, home_price, away_price FROM odds "
+                "WHERE retrieved_at = ? ORDER BY rowid",
+                (retrieved_at,),
+            ).fetchall()
+        events: Dict[str, Dict] = {}
+        for event_id, commence, home, away, key, title, update, home_p, away_p in rows:
+            event = events.setdefault(
+                event_id,
+                {
+                    "id": event_id,
+                    "commence_time": commence,
+                    "home_team": home,
+                    "away_team": away,
+                    "bookmakers": [],
+                },
+            )
+            if key is None:
+                continue
+            outcomes = [
+                {"name": name, "price": price}
+                for name, price in ((home, home_p), (away, away_p))
+                if price is not None
+            ]
+            event["bookmakers"].append(
+                {
+                    "key": key,
+                    "title": title,
+                    "last_update": update,
+                    "markets": [{"key": "h2h", "outcomes": outcomes}],
+                }
+            )
+        return list(events.values())
+
+    def latest(
+        self, max_age: float = REQUEST_COOLDOWN
+    ) -> Optional[Tuple[List[Dict], datetime]]:
+        """
+        method to get the latest odds, requesting a new snapshot if it is too old
+
+        Args:
+            max_age: seconds a snapshot can be used for before a new one is requested
+
+        Returns:
+            data: list of events (the-odds-api format)
+            request_time: time the snapshot was retrieved
+
+            or None if there is no snapshot and the request failed
+        """
+        with self.single_flight():
+            retrieved_at = self.snapshot_time()
+            if retrieved_at is None or time.time() - retrieved_at >= max_age:
+                data = self.request()
+                if data is not None:
+                    retrieved_at = time.time()
+                    self.append(data, retrieved_at)
+            if retrieved_at is None:
+                return None
+        return self.read(retrieved_at), datetime.fromtimestamp(retrieved_at)
+
+    def as_of(self, when: datetime) -> Optional[Tuple[List[Dict], datetime]]:
+        """
+        method to get the odds as they were at a given time (no API call is made)
+
+        Args:
+            when: time to get the odds at (naive datetimes are local time)
+
+        Returns:
+            data: list of events (the-odds-api format)
+            request_time: time the snapshot was retrieved
+
+            or None if there is no snapshot from before that time
+        """
+        retrieved_at = self.snapshot_time(when.timestamp())
+        if retrieved_at is None:
+            return None
+        return self.read(retrieved_at), datetime.fromtimestamp(retrieved_at)
+
+
+# shared store used by get_odds.py
+odds_store = OddsStore()
@@ -0,0 +1,360 @@
+from typing import Dict, List, Optional
+from datetime import date, datetime
+from server.publisher import TweetPublisher, publisher, tweet_lines
+import contextlib
+import threading
+import hashlib
+import sqlite3
+import socket
+import json
+import time
+import os
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# sqlite database holding every tweet (thread) queued to be sent
+OUTBOX_PATH = os.path.join(parent_dir, "data/outbox.db")
+
+# retry delays double after each failure: 30s, 1m, 2m, ... up to an hour
+BASE_RETRY_DELAY = 30
+MAX_RETRY_DELAY = 3600
+MAX_ATTEMPTS = 8
+
+# longest time the worker waits before checking the outbox again
+POLL_INTERVAL = 60
+
+# seconds after which a claim is considered abandoned (e.g. the process died)
+CLAIM_TIMEOUT = 600
+
+
+def outbox_key(tweets: List[str], purpose: str, day: date) -> str:
+    """
+    function to get the idempotency key of a thread
+        -> the same tweets queued twice for the same purpose and day are only sent
+           once (the same text on another day, e.g. a repeated result, is sent)
+
+    Args:
+        tweets: bodies of the tweets in the thread
+        purpose: what the thread is for (e.g. "predictions" or "results")
+        day: day the thread is sent on
+
+    Returns:
+        key: sha256 hex digest of the purpose, day, and tweets
+    """
+    raw = "\x1e".join([purpose, day.isoformat()] + tweets)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def retry_delay(attempts: int, error: Exception) -> Optional[float]:
+    """
+    function to get how long to wait before retrying a failed thread
+        -> rate limited requests (429) wait until the limit resets
+        -> other client errors (4xx) won't succeed on a retry
+
+    Args:
+        attempts: number of attempts made so far
+        error: error raised by the last attempt
+
+    Returns:
+        delay: seconds to wait or None if the thread shouldn't be retried
+    """
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    backoff = min(MAX_RETRY_DELAY, BASE_RETRY_DELAY * 2 ** (attempts - 1))
+    if status == 429:
+        reset = getattr(response, "headers", {}).get("x-rate-limit-reset")
+        if reset is not None:
+            return max(float(reset) - time.time(), 0) + 1
+        return backoff
+    if status is not None and 400 <= status < 500:
+        return None
+    if attempts >= MAX_ATTEMPTS:
+        return None
+    return backoff
+
+
+def claimant() -> str:
+    """function to get the name claims are made under (host, process, and thread)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+class Outbox:
+    """
+    durable queue of tweets (threads) to send, one row per thread in sqlite
+        -> each thread is keyed by a hash of its content so enqueueing is idempotent
+        -> tweets of a thread already sent are kept so a retry resumes the thread
+        -> failed threads are retried with exponential backoff (see retry_delay)
+        -> a thread is claimed in the database before it is sent, so two processes
+           draining the outbox (e.g. main.py and python3 predict.py) never both
+           send it
+    """
+
+    def __init__(self, db_path: str = OUTBOX_PATH):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+
+    @contextlib.contextmanager
+    def connect(self):
+        """context manager of a connection (committed when the block exits)"""
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        try:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS outbox ("
+                    "key TEXT PRIMARY KEY, tweets TEXT NOT NULL, "
+                    "tweet_ids TEXT NOT NULL, status TEXT NOT NULL, "
+                    "attempts INTEGER NOT NULL DEFAULT 0, next_attempt REAL NOT NULL, "
+                    "last_error TEXT, created_at REAL NOT NULL, sent_at REAL, "
+                    "claimed_by TEXT, claimed_at REAL)"
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt)"
+                )
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def enqueue(
+        self,
+        tweets: List[str],
+        purpose: str,
+        not_before: Optional[datetime] = None,
+    ) -> str:
+        """
+        method to queue a thread to be sent (returns right away)
+
+        Args:
+            tweets: bodies of the tweets in the order they should be read
+            purpose: what the thread is for (e.g. "predictions" or "results")
+            not_before: earliest time to send the thread (defaults to now)
+
+        Returns:
+            key: idempotency key of the thread
+        """
+        now = time.time()
+        send_at = not_before.timestamp() if not_before is not None else now
+        key = outbox_key(tweets, purpose, datetime.fromtimestamp(send_at).date())
+        with self.connect() as connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO outbox "
+                "(key, tweets, tweet_ids, status, next_attempt, created_at) "
+                "VALUES (?, ?, ?, 'pending', ?, ?)",
+                (key, json.dumps(tweets), json.dumps([None] * len(tweets)), send_at, now),
+            )
+        self.wakeup.set()
+        return key
+
+    def pending(self) -> List[Dict]:
+        """method to get every thread not yet sent (earliest first)"""
+        with self.connect() as connection:
+            rows = connection.execute(
+                "SELECT * FROM outbox WHERE status = 'pending' ORDER BY next_attempt"
+            ).fetchall()
+        return [
+            dict(row, tweets=json.loads(row["tweets"]), tweet_ids=json.loads(row["tweet_ids"]))
+            for row in rows
+        ]
+
+    def queued_lines(self) -> List[str]:
+        """method to get the lines of every tweet that is queued but not yet sent"""
+        return [
+            line
+            for entry in self.pending()
+            for tweet, tweet_id in zip(entry["tweets"], entry["tweet_ids"])
+            if not tweet_id
+            for line in tweet_lines(tweet)
+        ]
+
+    def claim(self, key: str) -> Optional[Dict]:
+        """
+        method to claim a pending thread for this process and thread
+            -> the claim is made in one UPDATE so only one claimant can succeed
+
+        Args:
+            key: idempotency key of the thread
+
+        Returns:
+            entry: outbox row of the thread as claimed or None if it is already
+                claimed, sent, or failed
+        """
+        now = time.time()
+        with self.connect() as connection:
+            cursor = connection.execute(
+                "UPDATE outbox SET claimed_by = ?, claimed_at = ? "
+                "WHERE key = ? AND status = 'pending' "
+                "AND (claimed_at IS NULL OR claimed_at < ?)",
+                (claimant(), now, key, now - CLAIM_TIMEOUT),
+            )
+            if cursor.rowcount != 1:
+                return None
+            row = connection.execute("SELECT * FROM outbox WHERE key = ?", (key,)).fetchone()
+        # read again after claiming: another claimant may have sent part of it
+        return dict(row, tweets=json.loads(row["tweets"]), tweet_ids=json.loads(row["tweet_ids"]))
+
+    def save_progress(self, key: str, tweet_ids: List[Optional[str]]) -> None:
+        """
+        method to save the id of each tweet of a claimed thread sent so far
+            -> called after every tweet so a thread interrupted partway (e.g. the
+               process is restarted) resumes after its last sent tweet
+            -> the claim is renewed so a long thread doesn't lose it
+
+        Args:
+            key: idempotency key of the thread
+            tweet_ids: id of each tweet sent so far (None for tweets that weren't)
+        """
+        with self.connect() as connection:
+            connection.execute(
+                "UPDATE outbox SET tweet_ids = ?, claimed_at = ? "
+                "WHERE key = ? AND claimed_by = ?",
+                (json.dumps(tweet_ids), time.time(), key, claimant()),
+            )
+
+    def next_attempt(self) -> Optional[float]:
+        """
+        method to get the time the next thread is due (None if nothing is queued)
+            -> a thread claimed by another process isn't due until its claim
+               expires (it's being sent, so waiting on it would spin)
+        """
+        with self.connect() as connection:
+            row = connection.execute(
+                "SELECT MIN(CASE WHEN claimed_at >= ? THEN claimed_at + ? "
+                "ELSE next_attempt END) FROM outbox WHERE status = 'pending'",
+                (time.time() - CLAIM_TIMEOUT, CLAIM_TIMEOUT),
+            ).fetchone()
+        return row[0] if row else None
+
+    def drain(self, sender: Optional[TweetPublisher] = None) -> int:
+        """
+        method to send every thread that is due
+            -> a rate limited thread delays the rest (they would hit the same limit)
+
+        Args:
+            sender: publisher used to send the tweets (defaults to the shared one)
+
+        Returns:
+            num_sent: number of threads sent completely
+        """
+        sender = sender or publisher
+        num_sent = 0
+        with self.lock:
+            for entry in self.pending():
+                if entry["next_attempt"] > time.time():
+                    break
+                entry = self.claim(entry["key"])
+                if entry is None:
+                    continue
+                tweet_ids = entry["tweet_ids"]
+                try:
+                    sender.send_thread(
+                        entry["tweets"],
+                        tweet_ids,
+                        lambda ids, key=entry["key"]: self.save_progress(key, ids),
+                    )
+                except Exception as e:
+                    self.record_failure(entry, tweet_ids, e)
+                    if getattr(getattr(e, "response", None), "status_code", None) == 429:
+                        break
+                    continue
+                with self.connect() as connection:
+                    connection.execute(
+                        "UPDATE outbox SET status = 'sent', tweet_ids = ?, "
+                        "attempts = attempts + 1, sent_at = ?, claimed_by = NULL, "
+                        "claimed_at = NULL WHERE key = ?",
+                        (json.dumps(tweet_ids), time.time(), entry["key"]),
+                    )
+                num_sent += 1
+        return num_sent
+
+    def record_failure(
+        self, entry: Dict, tweet_ids: List[Optional[str]], error: Exception
+    ) -> None:
+        """
+        method to save a failed attempt (and when to try again)
+
+        Args:
+            entry: outbox row of the thread (from pending)
+            tweet_ids: id of each tweet sent so far
+            error: error raised by the attempt
+        """
+        attempts = entry["attempts"] + 1
+        delay = retry_delay(attempts, error)
+        status = "pending" if delay is not None else "failed"
+        next_attempt = time.time() + (delay or 0)
+        print(
+            f"Error tweeting ({attempts} attempt(s)): {error}\n"
+            + (
+                f"Retrying at {datetime.fromtimestamp(next_attempt).strftime('%D - %I:%M:%S %p')}"
+                if delay is not None
+                else "Giving up on tweet"
+            )
+        )
+        with self.connect() as connection:
+            connection.execute(
+                "UPDATE outbox SET status = ?, tweet_ids = ?, attempts = ?, "
+                "next_attempt = ?, last_error = ?, claimed_by = NULL, claimed_at = NULL "
+                "WHERE key = ?",
+                (status, json.dumps(tweet_ids), attempts, next_attempt, str(error), entry["key"]),
+            )
+
+
+class OutboxWorker:
+    """
+    background thread that sends queued threads as they become due
+        -> wakes when a thread is enqueued, when one is due, or every POLL_INTERVAL
+    """
+
+    def __init__(self, box: Outbox, sender: Optional[TweetPublisher] = None):
+        self.box = box
+        self.sender = sender
+        self.thread: Optional[threading.Thread] = None
+        self.stopped = threading.Event()
+
+    def wait_time(self) -> float:
+        """method to get how long to wait before draining the outbox again"""
+        due = self.box.next_attempt()
+        if due is None:
+            return POLL_INTERVAL
+        return min(max(due - time.time(), 0), POLL_INTERVAL)
+
+    def run(self) -> None:
+        """method to drain the outbox until stopped"""
+        while not self.stopped.is_set():
+            self.box.wakeup.clear()
+            try:
+                self.box.drain(self.sender)
+            except Exception as e:
+                print(f"Error draining outbox. {e}")
+            self.box.wakeup.wait(self.wait_time())
+
+    def run_until_empty(self) -> None:
+        """method to drain the outbox (waiting for threads due later) until empty"""
+        while True:
+            self.box.wakeup.clear()
+            self.box.drain(self.sender)
+            if self.box.next_attempt() is None:
+                return
+            self.box.wakeup.wait(self.wait_time())
+
+    def start(self) -> None:
+        """method to start the worker thread (if it isn't running)"""
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, name="outbox", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """method to stop the worker thread"""
+        self.stopped.set()
+        self.box.wakeup.set()
+        if self.thread is not None:
+            self.thread.join()
+
+
+# shared outbox (and its worker) used by predict.py and main.py
+outbox = Outbox()
+outbox_worker = OutboxWorker(outbox)
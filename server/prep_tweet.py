@@ -1,89 +1,109 @@
-from server.get_odds import get_todays_odds
 from server.tweet_generator import gen_game_line
-from dotenv import load_dotenv  # type: ignore
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from ledger import ledger
 from datetime import datetime
-import pandas as pd  # type: ignore
 import subprocess
 import os
 
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore
+
 parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
 
-def get_data_path() -> str:
+def index_odds(games: List[Dict]) -> Dict[Tuple[str, str, str], Dict]:
     """
-    function that will fetch the current data sheet pathfrom .env file
+    function to index today's odds by matchup and start time
+
+    Args:
+        games: return of get_odds.get_todays_odds()[0]
+
+    Returns:
+        odds_index: {(home, away, time): game} for each game with odds
     """
-    parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    env_file_path = os.path.join(parent_dir, ".env")
-    load_dotenv(env_file_path)
-    data_sheet = os.getenv("DATA_SHEET_PATH")
-    return data_sheet if data_sheet is not None else "data/predictions.xlsx"
+    return {
+        (game.get("home_team"), game.get("away_team"), game.get("time")): game
+        for game in games or []
+    }
 
 
-def prepare(game_info: pd.Series) -> str:
+def prepare(
+    game_info: "pd.Series",
+    odds_index: Dict[Tuple[str, str, str], Dict],
+    retrieval_time: Optional[datetime],
+) -> Tuple[str, Dict]:
     """
-    function to update odds, construct tweet, and tweet prediction
-        -> get latest odds
+    function to update odds and construct the tweet line of a prediction
+        -> look up the game's latest odds in the odds index
         -> update odds in pandas Series
-        -> update row in excel sheet to match pandas series with new odds
         -> generate tweet using tweet_generator.gen_game_line
-        -> return game line for tweet 
+        -> return game line for tweet and the ledger columns to update
 
     Args:
-        game_info: pandas series with all game info
+        game_info: pandas series with all game info (a row of the ledger)
+        odds_index: return of index_odds (today's odds parsed once per run)
+        retrieval_time: time the odds were retrieved
 
     Returns:
         tweet: string of line to tweet
+        updates: {column: new value} for the game's row in the ledger
     """
-    data_file = os.path.join(parent_dir, get_data_path())
-    games, retrieval_time = get_todays_odds()
     home_odds, away_odds, home_odds_bookmaker, away_odds_bookmaker = (
         None,
         None,
         None,
         None,
     )
-    for game in games:
-        if (
-            game.get("home_team") == game_info.get("home")
-            and game.get("away_team") == game_info.get("away")
-            and game.get("time") == game_info.get("time")
-        ):
-            home, away = game_info["home"], game_info["away"]
-            home_odds = str(game.get(f"{home}_odds"))
-            away_odds = str(game.get(f"{away}_odds"))
-            home_odds_bookmaker = game.get(f"{home}_bookmaker")
-            away_odds_bookmaker = game.get(f"{away}_bookmaker")
-            break
-    df = pd.read_excel(data_file)
-    id = game_info.get("game_id")
-    row_index = df.loc[df["game_id"] == id].index[0]
-    df.at[row_index, "home_odds"] = (
-        home_odds if home_odds else df.at[row_index, "home_odds"]
-    )
-    df.at[row_index, "away_odds"] = (
-        away_odds if away_odds else df.at[row_index, "away_odds"]
-    )
-    df.at[row_index, "home_odds_bookmaker"] = (
-        home_odds_bookmaker
-        if home_odds_bookmaker
-        else df.at[row_index, "home_odds_bookmaker"]
-    )
-    df.at[row_index, "away_odds_bookmaker"] = (
-        away_odds_bookmaker
-        if away_odds_bookmaker
-        else df.at[row_index, "away_odds_bookmaker"]
-    )
-    df.at[row_index, "odds_retrieval_time"] = (
-        retrieval_time if home_odds else df.at[row_index, "odds_retrieval_time"]
-    )
+    home, away = game_info["home"], game_info["away"]
+    game = odds_index.get((home, away, game_info.get("time")))
+    if game is not None:
+        home_odds = str(game.get(f"{home}_odds"))
+        away_odds = str(game.get(f"{away}_odds"))
+        home_odds_bookmaker = game.get(f"{home}_bookmaker")
+        away_odds_bookmaker = game.get(f"{away}_bookmaker")
+    updates: Dict = {}
+    if home_odds:
+        updates["home_odds"] = home_odds
+        updates["odds_retrieval_time"] = retrieval_time
+    if away_odds:
+        updates["away_odds"] = away_odds
+    if home_odds_bookmaker:
+        updates["home_odds_bookmaker"] = home_odds_bookmaker
+    if away_odds_bookmaker:
+        updates["away_odds_bookmaker"] = away_odds_bookmaker
     print(
         f"\n{datetime.now().strftime('%D - %I:%M:%S %p')}... Odds checked for updates: "
         f"{game_info['away']} ({'no update' if not away_odds else str(away_odds)}) @ "
         f"{game_info['home']} ({'no update' if not home_odds else str(home_odds)})\n"
     )
-    updated_game_row = df.loc[row_index]
+    updated_game_row = game_info.copy()
+    for col, value in updates.items():
+        updated_game_row[col] = value
     tweet = gen_game_line(updated_game_row)
-    df.at[row_index, "tweet"] = tweet
-    df.to_excel(data_file, index=False)
-    return tweet
+    updates["tweet"] = tweet
+    return tweet, updates
+
+
+def prepare_all(
+    rows: "pd.DataFrame",
+    odds_index: Dict[Tuple[str, str, str], Dict],
+    retrieval_time: Optional[datetime],
+) -> List[str]:
+    """
+    function to update the odds and tweet lines of many predictions at once
+        -> one ledger write for every row
+
+    Args:
+        rows: data frame of predictions (rows of the ledger)
+        odds_index: return of index_odds (today's odds parsed once per run)
+        retrieval_time: time the odds were retrieved
+
+    Returns:
+        tweets: line to tweet for each row (in the same order)
+    """
+    tweets, updates = [], {}
+    for _, row in rows.iterrows():
+        tweet, updates[row["game_id"]] = prepare(row, odds_index, retrieval_time)
+        tweets.append(tweet)
+    ledger.update_many(updates)
+    return tweets
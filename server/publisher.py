@@ -0,0 +1,173 @@
+from typing import Callable, Dict, List, Optional
+from datetime import datetime
+from dotenv import load_dotenv  # type: ignore
+from ledger import ledger
+import threading
+import pytz  # type: ignore
+import os
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+cwd = os.path.dirname(os.path.abspath(__file__))
+
+# every tweet sent is appended to this log
+TWEET_LOG = os.path.join(cwd, "tweets.txt")
+
+
+def tweet_lines(tweet: str) -> List[str]:
+    """
+    function to split a tweet into the lines saved in the ledger (no formatting)
+
+    Args:
+        tweet: body of a tweet
+
+    Returns:
+        lines: each line without its bullet point or surrounding whitespace
+    """
+    return [line.replace("•", "").strip() for line in tweet.split("\n")]
+
+
+class TweepyTransport:
+    """
+    posts tweets with one tweepy.Client for the life of the process
+        -> the client (and its http session) is built on first use and reused
+    """
+
+    def __init__(self):
+        self._client = None
+        self.lock = threading.Lock()
+
+    @property
+    def client(self):
+        """tweepy client built from the keys in .env (on first use)"""
+        with self.lock:
+            if self._client is None:
+                import tweepy  # type: ignore
+
+                load_dotenv(os.path.join(parent_dir, ".env"))
+                self._client = tweepy.Client(
+                    consumer_key=os.getenv("CONSUMER_KEY"),
+                    consumer_secret=os.getenv("CONSUMER_SECRET"),
+                    access_token=os.getenv("ACCESS_TOKEN"),
+                    access_token_secret=os.getenv("ACCESS_TOKEN_SECRET"),
+                )
+            return self._client
+
+    def post(self, text: str, reply_to: Optional[str] = None) -> str:
+        """
+        method to post a tweet
+
+        Args:
+            text: body of the tweet
+            reply_to: id of the tweet this one replies to (None for a new tweet)
+
+        Returns:
+            tweet_id: id of the posted tweet
+        """
+        response = self.client.create_tweet(text=text, in_reply_to_tweet_id=reply_to)
+        return str(response.data["id"])
+
+
+class StubTransport:
+    """
+    transport that keeps tweets in memory instead of posting them (for tests)
+        -> fail_next makes the next n posts raise an exception
+    """
+
+    def __init__(self, fail_next: int = 0):
+        self.posts: List[Dict] = []
+        self.fail_next = fail_next
+        self.lock = threading.Lock()
+
+    def post(self, text: str, reply_to: Optional[str] = None) -> str:
+        with self.lock:
+            if self.fail_next > 0:
+                self.fail_next -= 1
+                raise RuntimeError("stub transport failure")
+            tweet_id = str(len(self.posts) + 1)
+            self.posts.append({"id": tweet_id, "text": text, "reply_to": reply_to})
+            return tweet_id
+
+
+class TweetPublisher:
+    """
+    sends tweets from within the process (no python3 subprocess per tweet)
+        -> prediction lines of every tweet sent are marked as tweeted in the ledger
+    """
+
+    def __init__(self, transport=None, log_path: Optional[str] = TWEET_LOG):
+        self.transport = transport or TweepyTransport()
+        self.log_path = log_path
+
+    def log(self, tweet: str) -> None:
+        """method to print a tweet and add it to the tweet log"""
+        now = datetime.now(pytz.timezone("US/Eastern")).strftime("%D - %I:%M:%S %p")
+        print(f"\n{now}... \nTweeting: '{tweet}'\n")
+        if self.log_path:
+            with open(self.log_path, "a") as f:
+                f.write(tweet + "\n")
+
+    def send_thread(
+        self,
+        tweets: List[str],
+        tweet_ids: List[Optional[str]],
+        on_sent: Optional[Callable[[List[Optional[str]]], None]] = None,
+    ) -> None:
+        """
+        method to send the tweets of a thread that haven't been sent yet
+            -> tweets with an id in tweet_ids were already sent and are skipped
+            -> raises the error of the first tweet that fails (ids are filled in place)
+            -> every tweet sent is marked as tweeted in one ledger transaction
+
+        Args:
+            tweets: bodies of the tweets in the order they should be read
+            tweet_ids: id of each tweet already sent (None for tweets that weren't)
+            on_sent: called with tweet_ids after each tweet is sent (e.g. to save
+                them before the next one, so a restart doesn't send it again)
+        """
+        sent = []
+        try:
+            for i, tweet in enumerate(tweets):
+                if tweet_ids[i]:
+                    continue
+                self.log(tweet)
+                reply_to = tweet_ids[i - 1] if i > 0 else None
+                tweet_ids[i] = self.transport.post(tweet, reply_to=reply_to)
+                sent.append(tweet)
+                if on_sent is not None:
+                    on_sent(tweet_ids)
+        finally:
+            ledger.mark_tweeted([line for tweet in sent for line in tweet_lines(tweet)])
+
+    def publish_thread(self, tweets: List[str]) -> List[Optional[str]]:
+        """
+        method to send tweets as a thread (each one a reply to the one before)
+            -> stops at the first tweet that fails (the rest would be out of order)
+
+        Args:
+            tweets: bodies of the tweets in the order they should be read
+
+        Returns:
+            tweet_ids: id of each tweet sent (None for tweets that weren't)
+        """
+        tweet_ids: List[Optional[str]] = [None] * len(tweets)
+        try:
+            self.send_thread(tweets, tweet_ids)
+        except Exception as e:
+            print(f"Error tweeting: {e}")
+        return tweet_ids
+
+    def publish(self, tweet: str) -> bool:
+        """
+        method to send a single tweet
+
+        Args:
+            tweet: body of the tweet
+
+        Returns:
+            bool: True or False to represent success or failure
+        """
+        return self.publish_thread([tweet])[0] is not None
+
+
+# shared publisher used by server/outbox.py
+publisher = TweetPublisher()
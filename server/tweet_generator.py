@@ -1,12 +1,14 @@
 from datetime import datetime
-from typing import List
-import pandas as pd
+from typing import TYPE_CHECKING, List
+from teams import teams
 import pytz
-import json
+
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore
 
 TWITTER_MAX_CHAR_COUNT = 268
 
-def gen_game_line(row: pd.Series) -> str:
+def gen_game_line(row: "pd.Series") -> str:
     """
     function to generate a single line in prediction tweet 
 
@@ -42,12 +44,8 @@ def gen_game_line(row: pd.Series) -> str:
         winner_odds, loser_odds = (away_odds, away_bookmaker), (home_odds, home_bookmaker)
     # winning_part = f"{winner} ({winner_odds[0]} on {winner_odds[1]})"
     # losing_part = f"{loser} ({loser_odds[0]} on {loser_odds[1]})"
-    with open('data/ids.json', 'r') as f:
-        data = json.load(f)
-    winner_id = data['team_to_id'][winner]
-    winner_abb = data['id_to_team'][str(winner_id)]['abbreviation']
-    loser_id = data['team_to_id'][loser]
-    loser_abb = data['id_to_team'][str(loser_id)]['abbreviation']
+    winner_abb = teams.team_to_abbreviation[winner]
+    loser_abb = teams.team_to_abbreviation[loser]
     winning_part = f"{winner_abb} ({winner_odds[0]})"
     losing_part = f"{loser_abb} ({loser_odds[0]})"
     tweet_line = f"{winning_part} to defeat {losing_part}"
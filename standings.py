@@ -0,0 +1,75 @@
+from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from datetime import date, datetime
+from cache import api, MUTABLE_TTL
+import threading
+import time
+
+# number of dates kept in memory (games are built a date or a few dates at a time)
+MAX_SNAPSHOTS = 32
+
+
+class StandingsSnapshots:
+    """
+    league standings keyed by date
+        -> one standings request per date, shared by every game on that date
+        -> each snapshot maps a team's id to its standings entry (w, l, gb, ...)
+        -> only the MAX_SNAPSHOTS most recently used dates are kept
+        -> a snapshot of today (or later) is taken again after MUTABLE_TTL, since
+           games are still finishing
+    """
+
+    def __init__(self):
+        # request date -> (snapshot, time it was taken)
+        self.snapshots: "OrderedDict[str, Tuple[Dict[int, Dict], float]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def expired(self, request_date: str, taken_at: float) -> bool:
+        """method to check if a snapshot may have changed since it was taken"""
+        day = datetime.strptime(request_date, "%m/%d/%Y").date()
+        return day >= date.today() and time.time() - taken_at > MUTABLE_TTL
+
+    def snapshot(self, request_date: str) -> Dict[int, Dict]:
+        """
+        method to get every team's standings as of a date
+
+        Args:
+            request_date: date of the standings (MM/DD/YYYY)
+
+        Returns:
+            snapshot: {team id: standings entry} for every team in the league
+        """
+        with self.lock:
+            cached = self.snapshots.get(request_date)
+            if cached is not None and not self.expired(request_date, cached[1]):
+                self.snapshots.move_to_end(request_date)
+                return cached[0]
+        standings = api.standings_data("103,104", date=request_date)
+        snapshot = {
+            int(team["team_id"]): team
+            for division in standings.values()
+            for team in division["teams"]
+        }
+        with self.lock:
+            self.snapshots[request_date] = (snapshot, time.time())
+            self.snapshots.move_to_end(request_date)
+            while len(self.snapshots) > MAX_SNAPSHOTS:
+                self.snapshots.popitem(last=False)
+        return snapshot
+
+    def team(self, team_id: int, request_date: str) -> Optional[Dict]:
+        """
+        method to get a single team's standings as of a date
+
+        Args:
+            team_id: id of the team
+            request_date: date of the standings (MM/DD/YYYY)
+
+        Returns:
+            standings: team's standings entry or None if not found
+        """
+        return self.snapshot(request_date).get(int(team_id))
+
+
+# shared snapshots used by data.py
+standings = StandingsSnapshots()
@@ -0,0 +1,183 @@
+from typing import TYPE_CHECKING, List, Optional, Set
+import os
+
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore
+
+cwd = os.path.dirname(os.path.abspath(__file__))
+
+# directory holding the season data files (data/seasons/<year>/<month>_<index>)
+SEASONS_DIR = os.path.join(cwd, "data/seasons")
+
+# non-feature columns of a game's data (everything else is a float32 feature)
+ID_COLUMNS = ["game-id", "date", "home-team", "away-team"]
+LABEL = "did-home-win"
+
+
+def to_columnar(df: "pd.DataFrame") -> "pd.DataFrame":
+    """
+    function to give game data the typed columns it is stored with
+        -> game-id int64, date/team names strings, label nullable bool
+        -> every feature float32 (values that aren't numbers become NaN)
+
+    Args:
+        df: data frame in the standard format (data.COLUMNS)
+
+    Returns:
+        typed: copy of df with typed columns
+    """
+    # pandas is imported when needed so importing the store (e.g. from
+    # data_retriever at start-up) stays light
+    import pandas as pd  # type: ignore
+
+    typed = df.copy()
+    typed["game-id"] = pd.to_numeric(typed["game-id"]).astype("int64")
+    for col in ["date", "home-team", "away-team"]:
+        typed[col] = typed[col].astype("string")
+    typed[LABEL] = typed[LABEL].astype("boolean")
+    for col in typed.columns:
+        if col not in ID_COLUMNS and col != LABEL:
+            typed[col] = pd.to_numeric(typed[col], errors="coerce").astype("float32")
+    return typed
+
+
+def save_games(df: "pd.DataFrame", file_path: str) -> None:
+    """
+    function to save game data to a parquet file
+
+    Args:
+        df: data frame in the standard format (data.COLUMNS)
+        file_path: path of the .parquet file to write
+    """
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # written to a temporary file first so readers never see partial files
+    tmp_path = f"{file_path}.{os.getpid()}.tmp"
+    to_columnar(df).to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, file_path)
+
+
+def append_games(df: "pd.DataFrame", file_path: str) -> int:
+    """
+    function to add games to a parquet file without duplicating any game
+        -> a game already in the file is replaced by its new row
+
+    Args:
+        df: data frame in the standard format (data.COLUMNS)
+        file_path: path of the .parquet file to add games to
+
+    Returns:
+        num_games: number of games in the file afterwards
+    """
+    import pandas as pd  # type: ignore
+
+    data = to_columnar(df)
+    if os.path.isfile(file_path):
+        data = pd.concat([pd.read_parquet(file_path), data], ignore_index=True)
+        data = data.drop_duplicates(subset="game-id", keep="last")
+    save_games(data, file_path)
+    return len(data)
+
+
+def find_files(data_dirs: List[str], extension: str) -> List[str]:
+    """
+    function to find every data file in the given directories (and below)
+
+    Args:
+        data_dirs: list of paths to folders with data files
+        extension: file extension to look for (e.g. '.parquet')
+
+    Returns:
+        paths: sorted paths of the data files found
+    """
+    paths = []
+    for data_dir in data_dirs:
+        for root, _, filenames in os.walk(data_dir):
+            for filename in filenames:
+                if filename.endswith(extension):
+                    paths.append(os.path.join(root, filename))
+    return sorted(paths)
+
+
+def convert_xlsx(
+    data_dirs: Optional[List[str]] = None, remove: bool = False
+) -> List[str]:
+    """
+    function to convert existing .xlsx data sheets into .parquet files
+        -> each sheet is written next to itself with the same name
+
+    Args:
+        data_dirs: list of paths to folders with .xlsx sheets (defaults to seasons)
+        remove: bool indicating if sheets should be deleted once converted
+
+    Returns:
+        converted: paths of the .parquet files written
+    """
+    import pandas as pd  # type: ignore
+
+    converted = []
+    for sheet in find_files(data_dirs or [SEASONS_DIR], ".xlsx"):
+        file_path = sheet[: -len(".xlsx")] + ".parquet"
+        save_games(pd.read_excel(sheet), file_path)
+        converted.append(file_path)
+        print(f"Converted {sheet} to {file_path}.")
+        if remove:
+            os.remove(sheet)
+    return converted
+
+
+def load_games(
+    data_dirs: Optional[List[str]] = None, columns: Optional[List[str]] = None
+) -> "pd.DataFrame":
+    """
+    function to load stored game data from .parquet files into one data frame
+        -> only the requested columns are read from disk
+
+    Args:
+        data_dirs: list of paths to folders with .parquet files (defaults to seasons)
+        columns: columns to load (defaults to every column)
+
+    Returns:
+        data: data frame with every stored game
+    """
+    import pandas as pd  # type: ignore
+
+    frames = [
+        pd.read_parquet(path, columns=columns)
+        for path in find_files(data_dirs or [SEASONS_DIR], ".parquet")
+    ]
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)
+
+
+def stored_game_ids(data_dirs: Optional[List[str]] = None) -> Set[int]:
+    """
+    function to get the id of every stored game (only the game-id column is read)
+
+    Args:
+        data_dirs: list of paths to folders with .parquet files (defaults to seasons)
+
+    Returns:
+        game_ids: set of stored game ids
+    """
+    ids = load_games(data_dirs, columns=["game-id"])["game-id"]
+    return set(int(game_id) for game_id in ids)
+
+
+def load_training_data(
+    order: List[str], data_dirs: Optional[List[str]] = None
+) -> "pd.DataFrame":
+    """
+    function to load only the label and the features used by a feature order
+
+    Args:
+        order: feature order used by the model (e.g. data.order2)
+        data_dirs: list of paths to folders with .parquet files (defaults to seasons)
+
+    Returns:
+        data: data frame with the label followed by the features in order
+    """
+    columns = [LABEL] + [col for col in order if col != LABEL]
+    return load_games(data_dirs, columns=columns)
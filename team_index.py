@@ -0,0 +1,170 @@
+from typing import Dict, List, Optional, Tuple
+from datetime import date
+from cache import api
+import numpy as np  # type: ignore
+import threading
+
+# daily totals kept for each team (also the suffix of each last10 feature)
+STATS = [
+    "runs",
+    "runs-allowed",
+    "hits",
+    "hits-allowed",
+    "ops",
+    "strikeouts",
+    "obp",
+    "avg",
+    "rbi",
+]
+
+# game types used for data (regular season and postseason)
+GAME_TYPES = ["R", "F", "D", "L", "W", "C", "P"]
+
+DAYS_IN_YEAR = 366
+
+
+def box_totals(box: Dict, team_id: int) -> List[float]:
+    """
+    function to pull a team's totals (in STATS order) out of a box score
+
+    Args:
+        box: return of statsapi.boxscore_data()
+        team_id: id of the team to get totals for
+
+    Returns:
+        totals: list of the team's totals in the game
+    """
+    isHome = box["home"]["team"]["id"] == team_id
+    game_stats = box["home"]["teamStats"] if isHome else box["away"]["teamStats"]
+    return [
+        game_stats["batting"]["runs"],
+        game_stats["pitching"]["runs"],
+        game_stats["batting"]["hits"],
+        game_stats["pitching"]["hits"],
+        float(game_stats["batting"]["ops"]),
+        game_stats["pitching"]["strikeOuts"],
+        float(game_stats["pitching"]["obp"]),
+        float(game_stats["batting"]["avg"]),
+        game_stats["batting"]["rbi"],
+    ]
+
+
+class TeamYear:
+    """
+    one team's daily totals for one calendar year
+        -> daily[d] holds the summed totals of the games on day d of the year
+        -> prefix[d] holds the sums of every day before d (for O(1) windows)
+    """
+
+    def __init__(self, team_id: int, year: int):
+        self.team_id = team_id
+        self.year = year
+        self.daily = np.zeros((DAYS_IN_YEAR, len(STATS)))
+        self.games = np.zeros(DAYS_IN_YEAR)
+        self.loaded = np.zeros(DAYS_IN_YEAR, dtype=bool)
+        self.prefix = np.zeros((DAYS_IN_YEAR + 1, len(STATS)))
+        self.prefix_games = np.zeros(DAYS_IN_YEAR + 1)
+        self.lock = threading.Lock()
+
+    def load(self, first: int, last: int) -> None:
+        """
+        method to load every day in [first, last] (days of the year) not yet loaded
+            -> one schedule request for the year and a box score per new game
+
+        Args:
+            first: first day of the year to load (0 is January 1st)
+            last: last day of the year to load
+        """
+        if self.loaded[first : last + 1].all():
+            return
+        start = date(self.year, 1, 1)
+        end = date(self.year, 12, 31)
+        games = api.schedule(
+            team=self.team_id,
+            start_date=start.strftime("%m/%d/%Y"),
+            end_date=end.strftime("%m/%d/%Y"),
+        )
+        for game in games:
+            if game.get("game_type") not in GAME_TYPES:
+                continue
+            day = (date.fromisoformat(game["game_date"]) - start).days
+            if not first <= day <= last or self.loaded[day]:
+                continue
+            box = api.boxscore_data(game["game_id"])
+            self.daily[day] += box_totals(box, self.team_id)
+            self.games[day] += 1
+        self.loaded[first : last + 1] = True
+        self.prefix[1:] = np.cumsum(self.daily, axis=0)
+        self.prefix_games[1:] = np.cumsum(self.games)
+
+    def window(self, first: int, last: int) -> Tuple[np.ndarray, float]:
+        """
+        method to get the summed totals and number of games in [first, last]
+
+        Args:
+            first: first day of the year in the window
+            last: last day of the year in the window
+
+        Returns:
+            totals: array of summed totals in STATS order
+            games: number of games played in the window
+        """
+        with self.lock:
+            self.load(first, last)
+            totals = self.prefix[last + 1] - self.prefix[first]
+            games = self.prefix_games[last + 1] - self.prefix_games[first]
+        return totals, games
+
+
+class TeamDailyIndex:
+    """
+    per-team, per-date index of daily batting and pitching totals
+        -> built from box scores the first time each day is needed
+        -> any N-day window average is a lookup into prefix sums
+    """
+
+    def __init__(self):
+        self.years: Dict[Tuple[int, int], TeamYear] = {}
+        self.lock = threading.Lock()
+
+    def team_year(self, team_id: int, year: int) -> TeamYear:
+        """method to get (or create) the index of a team's year"""
+        with self.lock:
+            key = (team_id, year)
+            if key not in self.years:
+                self.years[key] = TeamYear(team_id, year)
+            return self.years[key]
+
+    def window_averages(
+        self, team_id: int, start_date: date, end_date: date
+    ) -> Dict[str, Optional[float]]:
+        """
+        method to get a team's per game averages over a range of dates
+
+        Args:
+            team_id: id of the team
+            start_date: first date in the window
+            end_date: last date in the window
+
+        Returns:
+            averages: {stat: average per game (None if no games were played)}
+        """
+        totals = np.zeros(len(STATS))
+        games = 0.0
+        for year in range(start_date.year, end_date.year + 1):
+            first = max(start_date, date(year, 1, 1))
+            last = min(end_date, date(year, 12, 31))
+            year_start = date(year, 1, 1)
+            year_totals, year_games = self.team_year(team_id, year).window(
+                (first - year_start).days, (last - year_start).days
+            )
+            totals += year_totals
+            games += year_games
+        return {
+            stat: (float(totals[i]) / games if games else None)
+            for i, stat in enumerate(STATS)
+        }
+
+
+# shared index used by data.py
+team_index = TeamDailyIndex()
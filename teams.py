@@ -0,0 +1,102 @@
+from typing import Any, List, Mapping, Optional
+from types import MappingProxyType
+import subprocess
+import threading
+import json
+import os
+
+cwd = os.path.dirname(os.path.abspath(__file__))
+
+# ids and translation data (written by data/generate_ids.py)
+IDS_PATH = os.path.join(cwd, "data/ids.json")
+GENERATE_IDS_PATH = os.path.join(cwd, "data/generate_ids.py")
+
+
+def freeze(value: Any) -> Any:
+    """function to make a loaded json value read-only (dicts and lists nested)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class TeamDirectory:
+    """
+    team ids, names, abbreviations and divisions from the ids.json file
+        -> loaded the first time it is used (generated if needed) and never again
+        -> every table is read-only so it can be shared by data.py and server/
+    """
+
+    def __init__(self, path: str = IDS_PATH):
+        self.path = path
+        self._tables: Optional[Mapping[str, Mapping]] = None
+        self.lock = threading.Lock()
+
+    @property
+    def tables(self) -> Mapping[str, Mapping]:
+        """every table of the ids.json file (loaded on first use)"""
+        if self._tables is None:
+            with self.lock:
+                if self._tables is None:
+                    if not os.path.isfile(self.path):
+                        subprocess.run(["python3", GENERATE_IDS_PATH])
+                    with open(self.path, "r") as f:
+                        self._tables = freeze(json.load(f))
+        return self._tables
+
+    @property
+    def id_to_team(self) -> Mapping[str, Mapping]:
+        """{id (str): {<team_info>}}"""
+        return self.tables["id_to_team"]
+
+    @property
+    def team_to_id(self) -> Mapping[str, int]:
+        """{team name: id}"""
+        return self.tables["team_to_id"]
+
+    @property
+    def team_to_abbreviation(self) -> Mapping[str, str]:
+        """{team name: abbreviation}"""
+        return self.tables["team_to_abbreviation"]
+
+    @property
+    def league_dict(self) -> Mapping[str, int]:
+        """{'a' or 'n': league id}"""
+        return self.tables["league_dict"]
+
+    @property
+    def division_teams(self) -> Mapping[str, List[str]]:
+        """{division name: (team names)}"""
+        return self.tables["division_teams"]
+
+    @property
+    def division_to_id(self) -> Mapping[str, int]:
+        """{division name: division id}"""
+        return self.tables["division_to_id"]
+
+    @property
+    def id_to_division(self) -> Mapping[str, str]:
+        """{division id (str): division name}"""
+        return self.tables["id_to_division"]
+
+    def id(self, team: str) -> Optional[int]:
+        """method to get a team's id from its name (e.g. "New York Mets")"""
+        return self.team_to_id.get(team)
+
+    def abbreviation(self, team: str) -> Optional[str]:
+        """method to get a team's abbreviation from its name (e.g. "NYM")"""
+        return self.team_to_abbreviation.get(team)
+
+    def name(self, team_id: int) -> Optional[str]:
+        """method to get a team's name from its id"""
+        team = self.id_to_team.get(str(team_id))
+        return team["name"] if team else None
+
+    def ids(self) -> List[int]:
+        """method to get the id of every team"""
+        return [int(team_id) for team_id in self.id_to_team]
+
+
+# shared directory used by data.py, leaders.py and server/
+teams = TeamDirectory()